@@ -6,9 +6,10 @@ Example usage of GitHub Contributions Tracker with Bedrock integration
 import os
 import sys
 from datetime import datetime, timedelta
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Make the package importable from a source checkout, but only once per process
+if 'github_contributions_tracker' not in sys.modules:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from github_contributions_tracker import GitHubContributionsTracker, BedrockSummarizer
 
 def example_basic_usage():
@@ -132,9 +133,9 @@ def example_custom_bedrock_model():
 """
     
     try:
-        # Use a different model (Haiku for faster processing)
+        # Use a different model (Sonnet for more detailed analysis)
         summarizer = BedrockSummarizer(
-            model_id="anthropic.claude-3-haiku-20240307-v1:0",
+            model_id="anthropic.claude-3-sonnet-20240229-v1:0",
             region="us-east-1"
         )
         
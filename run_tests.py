@@ -3,25 +3,19 @@
 Simple test runner for GitHub Contributions Tracker
 """
 
-import unittest
-import sys
+import importlib.util
 import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import subprocess
+import sys
 
 def run_tests():
-    """Run all tests."""
-    # Discover and run tests
-    loader = unittest.TestLoader()
-    start_dir = 'tests'
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    """Run all tests, in parallel when pytest-xdist is installed."""
+    command = [sys.executable, '-m', 'pytest', 'tests']
+    if importlib.util.find_spec('xdist') is not None:
+        command[3:3] = ['-n', 'auto']
     
-    return result.wasSuccessful()
+    return subprocess.call(command, cwd=os.path.dirname(os.path.abspath(__file__))) == 0
 
 if __name__ == '__main__':
     success = run_tests()
-    sys.exit(0 if success else 1) 
+    sys.exit(0 if success else 1)
@@ -6,14 +6,23 @@ A Python package to track your GitHub contributions for a specified time range
 and generate comprehensive summaries with AI-powered insights using Amazon Bedrock.
 """
 
-from .tracker import GitHubContributionsTracker
-from .bedrock_summarizer import BedrockSummarizer
+from .tracker import CommitRec, GitHubContributionsTracker
 
 __version__ = "1.0.0"
 __author__ = "GitHub Contributions Tracker"
 __email__ = ""
 
+
+def __getattr__(name):
+    """Import ``BedrockSummarizer`` only when it is first accessed."""
+    if name == "BedrockSummarizer":
+        from .bedrock_summarizer import BedrockSummarizer
+        return BedrockSummarizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
+    "CommitRec",
     "GitHubContributionsTracker",
     "BedrockSummarizer",
 ] 
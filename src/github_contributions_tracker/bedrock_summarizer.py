@@ -3,43 +3,65 @@
 Bedrock summarizer module for GitHub Contributions Tracker
 """
 
+import asyncio
+import functools
+import hashlib
 import json
-import boto3
+import os
+import re
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+from urllib.parse import quote
 
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
 
-class BedrockSummarizer:
-    """Summarize contributions using Amazon Bedrock."""
-    
-    def __init__(self, model_id: str = "anthropic.claude-3-sonnet-20240229-v1:0", 
-                 region: str = "us-east-1", max_tokens: int = 2000):
-        """
-        Initialize the Bedrock summarizer.
-        
-        Args:
-            model_id: Bedrock model ID to use
-            region: AWS region for Bedrock
-            max_tokens: Maximum tokens for response
-        """
-        self.model_id = model_id
-        self.max_tokens = max_tokens
-        self.bedrock_runtime = boto3.client(
-            service_name='bedrock-runtime',
-            region_name=region
-        )
-    
-    def create_summary_prompt(self, contributions_list: str) -> str:
-        """
-        Create a prompt for summarizing contributions.
-        
-        Args:
-            contributions_list: String containing the list of contributions
-            
-        Returns:
-            Formatted prompt for Bedrock
-        """
-        prompt = f"""Hi, would you create a more succinct summary based on this list of contributions?
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
+
+from .cache import DiskCache
+
+# Haiku is fast and inexpensive for the strictly formatted summary task
+DEFAULT_MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0"
 
-{contributions_list}
+# Inputs shorter than this are not worth a Bedrock round-trip
+MIN_SUMMARIZE_CHARS = 100
+
+# Inputs longer than this are summarized in chunks whose summaries are then merged
+CHUNK_THRESHOLD = 24000
+
+# Error codes that mean Bedrock is over quota rather than rejecting the request
+_THROTTLING_ERROR_CODES = frozenset((
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'ServiceUnavailableException',
+))
+
+# Returned without calling Bedrock when there is nothing to summarize
+_EMPTY_SUMMARY_TEMPLATE = """# GitHub Contributions Summary - High-Level Tasks
+
+## Overview
+- No contributions to summarize.
+
+## High-Level Tasks Completed
+
+No contributions were found in the specified time period."""
+
+# Static parts of the summary prompt, built once at import time
+_PROMPT_PREFIX = """Hi, would you create a more succinct summary based on this list of contributions?
+
+"""
+
+_PROMPT_SUFFIX = """
 
 I would like a comprehensive summary that follows this exact format:
 
@@ -75,8 +97,159 @@ I would like a comprehensive summary that follows this exact format:
 - [Impact statement 3]
 
 Please analyze the contributions and group them into logical high-level categories. Focus on the main themes and patterns in the work, not individual commits. Make it professional and strategic, highlighting the key accomplishments and their business impact."""
+
+# Prompt for summarizing one chunk of a large contributions list
+_CHUNK_PROMPT_PREFIX = """Here is one part of a longer list of GitHub contributions. Summarize the main themes and tasks in this part as a concise bullet list, grouping related commits together:
+
+"""
+
+# Prompt for merging the chunk summaries, followed by _PROMPT_SUFFIX
+_MERGE_PROMPT_PREFIX = """Hi, would you create a more succinct summary based on this overview and these partial summaries of a list of contributions?
+
+"""
+
+
+# boto3, botocore and httpx are imported on first use so that importing the
+# package (and running the CLI without --bedrock) stays fast
+
+@functools.lru_cache(maxsize=None)
+def _import_httpx():
+    """Return the httpx module, or None when it is not installed."""
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover - exercised only without httpx installed
+        return None
+    return httpx
+
+
+@functools.lru_cache(maxsize=8)
+def _get_bedrock_client(region: str):
+    """Return a shared bedrock-runtime client for a region."""
+    import boto3
+    from botocore.config import Config
+    
+    return boto3.client(
+        service_name='bedrock-runtime',
+        region_name=region,
+        config=Config(
+            # Adaptive mode backs off with jitter and rate-limits the client on throttling
+            retries={'mode': 'adaptive', 'max_attempts': 8},
+            read_timeout=120,
+            connect_timeout=10,
+            tcp_keepalive=True,
+            max_pool_connections=32
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the thread pool shared by all summarizers for blocking boto3 calls without httpx."""
+    return ThreadPoolExecutor(max_workers=16)
+
+
+# Credentials for signing direct HTTP requests, resolved once per process
+_CREDENTIALS = None
+
+
+def _get_frozen_credentials():
+    """
+    Return a frozen snapshot of the process-wide AWS credentials.
+    
+    The credential chain (environment, config files, instance metadata) is
+    resolved on first use only. Refreshable credentials renew themselves
+    here once they are close to expiring.
+    """
+    global _CREDENTIALS
+    if _CREDENTIALS is None:
+        import boto3
         
-        return prompt
+        _CREDENTIALS = boto3.Session().get_credentials()
+        if _CREDENTIALS is None:
+            raise RuntimeError("No AWS credentials found for signing Bedrock requests")
+    return _CREDENTIALS.get_frozen_credentials()
+
+
+class BedrockSummarizer:
+    """Summarize contributions using Amazon Bedrock."""
+    
+    def __init__(self, model_id: str = DEFAULT_MODEL_ID, 
+                 region: str = "us-east-1", max_tokens: int = 2000, use_cache: bool = False):
+        """
+        Initialize the Bedrock summarizer.
+        
+        Args:
+            model_id: Bedrock model ID to use
+            region: AWS region for Bedrock
+            max_tokens: Maximum tokens for response
+            use_cache: Reuse summaries stored on disk for identical contributions
+        """
+        self.model_id = model_id
+        self.region = region
+        self.max_tokens = max_tokens
+        self.bedrock_runtime = _get_bedrock_client(region)
+        self.endpoint = (f"https://bedrock-runtime.{region}.amazonaws.com"
+                         f"/model/{quote(model_id, safe='')}/invoke")
+        self._client = None
+        self._cache = DiskCache('bedrock') if use_cache else None
+        # Pre-encoded request JSON around the message content, which is the only part that changes
+        self._body_prefix = (b'{"anthropic_version":"bedrock-2023-05-31","max_tokens":' + str(max_tokens).encode()
+                             + b',"messages":[{"role":"user","content":')
+        self._body_suffix = b'}]}'
+    
+    def create_summary_prompt(self, contributions_list: str) -> str:
+        """
+        Create a prompt for summarizing contributions.
+        
+        Args:
+            contributions_list: String containing the list of contributions
+            
+        Returns:
+            Formatted prompt for Bedrock
+        """
+        return _PROMPT_PREFIX + contributions_list + _PROMPT_SUFFIX
+    
+    def _build_request_body(self, prompt: str) -> bytes:
+        """Build the JSON request body for the Anthropic messages API."""
+        return self._body_prefix + _json_dumps(prompt) + self._body_suffix
+    
+    def _parse_response_body(self, body) -> str:
+        """Extract the summary text from a Bedrock response body."""
+        response_body = _json_loads(body)
+        return response_body['content'][0]['text'].strip()
+    
+    def _error_summary(self, error: Exception, contributions_list: str) -> str:
+        """Report a failed summarization and return the original contributions."""
+        print(f"Error summarizing contributions with Bedrock: {error}")
+        return f"Error generating summary: {error}\n\nOriginal contributions:\n{contributions_list}"
+    
+    def _handle_client_error(self, error: Exception, contributions_list: str) -> str:
+        """Return an error summary when Bedrock is throttling, re-raise any other error."""
+        if error.response.get('Error', {}).get('Code') in _THROTTLING_ERROR_CODES:
+            return self._error_summary(error, contributions_list)
+        raise error
+    
+    def _is_trivial(self, contributions_list: str) -> bool:
+        """Check whether a contributions list is too small to be worth summarizing."""
+        return (len(contributions_list.strip()) < MIN_SUMMARIZE_CHARS
+                or "Total Commits**: 0" in contributions_list)
+    
+    def _cache_key(self, contributions_list: str) -> str:
+        """Build the cache key for a contributions list."""
+        digest = hashlib.sha256(contributions_list.encode('utf-8')).hexdigest()
+        return f"{self.model_id}:{digest}"
+    
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """Return the shared async HTTP client, creating it on first use."""
+        if self._client is None:
+            httpx = _import_httpx()
+            # HTTP/2 multiplexes concurrent summaries over a few long-lived connections
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(120.0, connect=10.0),
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60)
+            )
+        return self._client
     
     def summarize_contributions(self, contributions_list: str) -> str:
         """
@@ -88,28 +261,425 @@ Please analyze the contributions and group them into logical high-level categori
         Returns:
             Summarized contributions in markdown format
         """
+        if self._is_trivial(contributions_list):
+            return _EMPTY_SUMMARY_TEMPLATE
+        
+        if self._cache is not None:
+            cached = self._cache.get(self._cache_key(contributions_list))
+            if cached is not None:
+                return cached
+        
+        from botocore.exceptions import ClientError
+        
+        prompt = self.create_summary_prompt(contributions_list)
+        
+        try:
+            summary = self._invoke_sync(prompt)
+        except ClientError as e:
+            return self._handle_client_error(e, contributions_list)
+        
+        if self._cache is not None:
+            self._cache.set(self._cache_key(contributions_list), summary)
+        return summary
+    
+    def _invoke_sync(self, prompt: str) -> str:
+        """Send a prompt through the blocking boto3 client."""
+        response = self.bedrock_runtime.invoke_model(
+            modelId=self.model_id,
+            body=self._build_request_body(prompt)
+        )
+        
+        return self._parse_response_body(response.get('body').read())
+    
+    def summarize_contributions_stream(self, contributions_list: str) -> Iterator[str]:
+        """
+        Summarize contributions, yielding the text as Bedrock generates it.
+        
+        Args:
+            contributions_list: String containing the list of contributions
+            
+        Yields:
+            Pieces of the summary in markdown format
+        """
+        if self._is_trivial(contributions_list):
+            yield _EMPTY_SUMMARY_TEMPLATE
+            return
+        
+        if self._cache is not None:
+            cached = self._cache.get(self._cache_key(contributions_list))
+            if cached is not None:
+                yield cached
+                return
+        
+        from botocore.exceptions import ClientError
+        
+        prompt = self.create_summary_prompt(contributions_list)
+        parts = []
+        
+        try:
+            response = self.bedrock_runtime.invoke_model_with_response_stream(
+                modelId=self.model_id,
+                body=self._build_request_body(prompt)
+            )
+            
+            for event in response['body']:
+                chunk = event.get('chunk')
+                if not chunk:
+                    continue
+                payload = _json_loads(chunk['bytes'])
+                if payload.get('type') != 'content_block_delta':
+                    continue
+                text = payload['delta'].get('text', '')
+                if not parts:
+                    # Match the stripped output of summarize_contributions
+                    text = text.lstrip()
+                if text:
+                    parts.append(text)
+                    yield text
+                    
+        except ClientError as e:
+            yield self._handle_client_error(e, contributions_list)
+            return
+        
+        if self._cache is not None and parts:
+            self._cache.set(self._cache_key(contributions_list), ''.join(parts).strip())
+    
+    async def asummarize_contributions(self, contributions_list: str) -> str:
+        """
+        Summarize contributions without blocking the event loop.
+        
+        The request is signed with SigV4 and sent through a shared
+        ``httpx.AsyncClient``, so many summaries can be awaited concurrently.
+        Without httpx installed, the boto3 call runs in a thread pool instead.
+        
+        Args:
+            contributions_list: String containing the list of contributions
+            
+        Returns:
+            Summarized contributions in markdown format
+        """
+        if self._is_trivial(contributions_list):
+            return _EMPTY_SUMMARY_TEMPLATE
+        
+        if self._cache is not None:
+            cached = self._cache.get(self._cache_key(contributions_list))
+            if cached is not None:
+                return cached
+        
+        from botocore.exceptions import ClientError
+        
         prompt = self.create_summary_prompt(contributions_list)
         
         try:
-            response = self.bedrock_runtime.invoke_model(
+            summary = await self._ainvoke(prompt)
+        except ClientError as e:
+            return self._handle_client_error(e, contributions_list)
+        
+        if self._cache is not None:
+            self._cache.set(self._cache_key(contributions_list), summary)
+        return summary
+    
+    async def _ainvoke(self, prompt: str) -> str:
+        """Send a prompt to Bedrock without blocking the event loop."""
+        if _import_httpx() is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_executor(), self._invoke_sync, prompt)
+        
+        from botocore.auth import SigV4Auth
+        from botocore.awsrequest import AWSRequest
+        from botocore.exceptions import ClientError
+        
+        body = self._build_request_body(prompt)
+        request = AWSRequest(method='POST', url=self.endpoint, data=body,
+                             headers={'Content-Type': 'application/json',
+                                      'Accept': 'application/json'})
+        SigV4Auth(_get_frozen_credentials(), 'bedrock', self.region).add_auth(request)
+        prepped = request.prepare()
+        
+        response = await self._get_http_client().post(
+            prepped.url, headers=dict(prepped.headers), content=body
+        )
+        if response.is_error:
+            # Surface HTTP failures the same way boto3 does on the blocking path
+            error_code = response.headers.get('x-amzn-ErrorType', str(response.status_code)).split(':')[0]
+            raise ClientError({
+                'Error': {'Code': error_code, 'Message': response.text},
+                'ResponseMetadata': {'HTTPStatusCode': response.status_code}
+            }, 'InvokeModel')
+        
+        return self._parse_response_body(response.content)
+    
+    async def _gather_limited(self, func, items: list, max_concurrency: int) -> list:
+        """Await ``func`` over items with at most ``max_concurrency`` calls in flight."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(item):
+            async with semaphore:
+                return await func(item)
+        
+        return await asyncio.gather(*(run_one(item) for item in items), return_exceptions=True)
+    
+    def _run_async(self, coroutine):
+        """Run a coroutine from synchronous code and close the HTTP client afterwards."""
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                # The HTTP client is bound to this event loop
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    async def asummarize_many(self, items: List[str], max_concurrency: int = 10) -> List[str]:
+        """
+        Summarize several contribution lists concurrently.
+        
+        Args:
+            items: Contribution lists to summarize
+            max_concurrency: Maximum number of Bedrock requests in flight
+            
+        Returns:
+            Summaries in the same order as ``items``
+        """
+        results = await self._gather_limited(self.asummarize_contributions, items, max_concurrency)
+        # Throttling already became an error summary, so anything raised here is a real failure
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+    
+    def summarize_many(self, items: List[str], max_concurrency: int = 10) -> List[str]:
+        """
+        Summarize several contribution lists concurrently from synchronous code.
+        
+        Args:
+            items: Contribution lists to summarize
+            max_concurrency: Maximum number of Bedrock requests in flight
+            
+        Returns:
+            Summaries in the same order as ``items``
+        """
+        return self._run_async(self.asummarize_many(items, max_concurrency))
+    
+    def _split_contributions(self, contributions_list: str, chunk_chars: int) -> Tuple[str, List[str]]:
+        """
+        Split a contributions list into its overview and chunks of whole lines.
+        
+        Args:
+            contributions_list: String containing the list of contributions
+            chunk_chars: Maximum size of each chunk
+            
+        Returns:
+            Tuple of the overview text and the list of chunks
+        """
+        overview = []
+        chunks = []
+        current = []
+        current_header = None
+        size = 0
+        
+        for section in re.split(r'(?m)^(?=## )', contributions_list):
+            if not section.startswith('## ') or section.startswith('## Overview'):
+                overview.append(section.strip())
+                continue
+            
+            header, _, body = section.partition('\n')
+            for line in body.splitlines():
+                if not line.strip():
+                    continue
+                if current and size + len(line) + 1 > chunk_chars:
+                    chunks.append('\n'.join(current))
+                    current, current_header, size = [], None, 0
+                # Repeat the section heading at the start of every chunk
+                if header != current_header:
+                    current.append(header)
+                    current_header = header
+                    size += len(header) + 1
+                current.append(line)
+                size += len(line) + 1
+        
+        if current:
+            chunks.append('\n'.join(current))
+        return '\n\n'.join(part for part in overview if part), chunks
+    
+    async def asummarize_map_reduce(self, contributions_list: str, chunk_chars: int = 8000,
+                                    max_concurrency: int = 10) -> str:
+        """
+        Summarize a large contributions list by summarizing chunks concurrently, then merging them.
+        
+        Args:
+            contributions_list: String containing the list of contributions
+            chunk_chars: Maximum size of each chunk sent to Bedrock
+            max_concurrency: Maximum number of Bedrock requests in flight
+            
+        Returns:
+            Summarized contributions in markdown format
+        """
+        # Zero-commit lists can still be long when many repositories are listed
+        if self._is_trivial(contributions_list):
+            return _EMPTY_SUMMARY_TEMPLATE
+        
+        overview, chunks = self._split_contributions(contributions_list, chunk_chars)
+        if len(chunks) <= 1:
+            return await self.asummarize_contributions(contributions_list)
+        
+        if self._cache is not None:
+            cached = self._cache.get(self._cache_key(contributions_list))
+            if cached is not None:
+                return cached
+        
+        from botocore.exceptions import ClientError
+        
+        print(f"Summarizing {len(chunks)} chunks of contributions...")
+        try:
+            partials = await self._gather_limited(
+                self._ainvoke, [_CHUNK_PROMPT_PREFIX + chunk for chunk in chunks], max_concurrency
+            )
+            for partial in partials:
+                if isinstance(partial, BaseException):
+                    raise partial
+            
+            merge_input = f"{overview}\n\n## Partial Summaries\n\n" + "\n\n".join(partials)
+            summary = await self._ainvoke(_MERGE_PROMPT_PREFIX + merge_input + _PROMPT_SUFFIX)
+        except ClientError as e:
+            return self._handle_client_error(e, contributions_list)
+        
+        if self._cache is not None:
+            self._cache.set(self._cache_key(contributions_list), summary)
+        return summary
+    
+    def summarize_map_reduce(self, contributions_list: str, chunk_chars: int = 8000,
+                             max_concurrency: int = 10) -> str:
+        """
+        Summarize a large contributions list in chunks from synchronous code.
+        
+        Args:
+            contributions_list: String containing the list of contributions
+            chunk_chars: Maximum size of each chunk sent to Bedrock
+            max_concurrency: Maximum number of Bedrock requests in flight
+            
+        Returns:
+            Summarized contributions in markdown format
+        """
+        return self._run_async(self.asummarize_map_reduce(contributions_list, chunk_chars, max_concurrency))
+    
+    def summarize_batch(self, inputs: List[str], s3_bucket: str, s3_prefix: str, role_arn: str,
+                        poll_interval: float = 30.0, max_poll_interval: float = 300.0) -> List[str]:
+        """
+        Summarize many contribution lists with a single Bedrock batch inference job.
+        
+        The prompts are written to a JSONL manifest in S3, processed by
+        ``create_model_invocation_job`` and read back from the job output.
+        Bedrock enforces a minimum number of records per batch job, so this
+        is meant for large multi-user or multi-period runs.
+        
+        Args:
+            inputs: Contribution lists to summarize
+            s3_bucket: S3 bucket used for the job input and output
+            s3_prefix: Key prefix for the job files inside the bucket
+            role_arn: IAM role Bedrock assumes to access the bucket
+            poll_interval: Initial delay in seconds between status checks
+            max_poll_interval: Upper bound for the exponential poll backoff
+            
+        Returns:
+            Summaries in the same order as ``inputs``
+        """
+        if not inputs:
+            return []
+        
+        # Only send inputs that actually need a model response
+        trivial = [self._is_trivial(contributions_list) for contributions_list in inputs]
+        if any(trivial):
+            pending = [contributions_list for contributions_list, skip in zip(inputs, trivial) if not skip]
+            results = iter(self.summarize_batch(pending, s3_bucket, s3_prefix, role_arn,
+                                                poll_interval, max_poll_interval))
+            return [_EMPTY_SUMMARY_TEMPLATE if skip else next(results) for skip in trivial]
+        
+        import boto3
+        from botocore.exceptions import ClientError
+        
+        s3 = boto3.client(service_name='s3', region_name=self.region)
+        bedrock = boto3.client(service_name='bedrock', region_name=self.region)
+        
+        job_name = f"ghct-{uuid.uuid4().hex[:16]}"
+        prefix = f"{s3_prefix.strip('/')}/{job_name}" if s3_prefix.strip('/') else job_name
+        input_key = f"{prefix}/input.jsonl"
+        output_prefix = f"{prefix}/output"
+        
+        record_ids = [uuid.uuid4().hex for _ in inputs]
+        
+        try:
+            # Write the manifest locally, then upload it for the job
+            with tempfile.NamedTemporaryFile('w', suffix='.jsonl', encoding='utf-8', delete=False) as f:
+                manifest_path = f.name
+                for record_id, contributions_list in zip(record_ids, inputs):
+                    model_input = _json_loads(self._build_request_body(self.create_summary_prompt(contributions_list)))
+                    f.write(json.dumps({"recordId": record_id, "modelInput": model_input}) + "\n")
+            try:
+                s3.upload_file(manifest_path, s3_bucket, input_key)
+            finally:
+                os.remove(manifest_path)
+            
+            job = bedrock.create_model_invocation_job(
+                jobName=job_name,
+                roleArn=role_arn,
                 modelId=self.model_id,
-                body=json.dumps({
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": self.max_tokens,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ]
-                })
+                inputDataConfig={
+                    's3InputDataConfig': {
+                        's3Uri': f"s3://{s3_bucket}/{input_key}",
+                        's3InputFormat': 'JSONL'
+                    }
+                },
+                outputDataConfig={
+                    's3OutputDataConfig': {
+                        's3Uri': f"s3://{s3_bucket}/{output_prefix}/"
+                    }
+                }
             )
+            job_arn = job['jobArn']
+            print(f"Submitted Bedrock batch job {job_name} with {len(inputs)} records")
             
-            response_body = json.loads(response.get('body').read())
-            summary = response_body['content'][0]['text'].strip()
+            # Poll with exponential backoff until the job finishes
+            delay = poll_interval
+            while True:
+                status = bedrock.get_model_invocation_job(jobIdentifier=job_arn)
+                state = status['status']
+                if state in ('Completed', 'PartiallyCompleted'):
+                    break
+                if state in ('Failed', 'Stopped', 'Expired'):
+                    raise RuntimeError(f"Batch job {job_name} ended with status {state}: {status.get('message', '')}")
+                print(f"  Batch job status: {state}, checking again in {int(delay)}s")
+                time.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
             
-            return summary
+            # Stream the job output and map records back to input order
+            job_id = job_arn.rsplit('/', 1)[-1]
+            output = s3.get_object(Bucket=s3_bucket, Key=f"{output_prefix}/{job_id}/input.jsonl.out")
+            results = {}
+            errors = {}
+            for line in output['Body'].iter_lines():
+                if not line:
+                    continue
+                record = _json_loads(line)
+                if 'modelOutput' in record:
+                    results[record['recordId']] = record['modelOutput']['content'][0]['text'].strip()
+                else:
+                    errors[record['recordId']] = record.get('error', 'missing model output')
             
-        except Exception as e:
-            print(f"Error summarizing contributions with Bedrock: {e}")
-            return f"Error generating summary: {e}\n\nOriginal contributions:\n{contributions_list}" 
+        except ClientError as e:
+            return [self._handle_client_error(e, contributions_list) for contributions_list in inputs]
+        
+        summaries = []
+        for record_id, contributions_list in zip(record_ids, inputs):
+            if record_id in results:
+                summaries.append(results[record_id])
+            else:
+                error = errors.get(record_id, 'record missing from batch output')
+                summaries.append(self._error_summary(error, contributions_list))
+        return summaries
+    
+    async def aclose(self):
+        """Close the shared async HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Disk cache module for GitHub Contributions Tracker
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'ghct'
+
+
+class DiskCache:
+    """Store JSON-serializable values on disk, keyed by arbitrary strings."""
+
+    def __init__(self, namespace: str, ttl: Optional[float] = None, directory: str = None,
+                 compress: bool = False):
+        """
+        Initialize the disk cache.
+
+        Args:
+            namespace: Subdirectory separating different kinds of cached data
+            ttl: Default time-to-live in seconds, or None to never expire
+            directory: Base cache directory (default: $GHCT_CACHE_DIR or ~/.cache/ghct)
+            compress: Store entries gzip-compressed, for large values
+        """
+        base_dir = directory or os.getenv('GHCT_CACHE_DIR') or DEFAULT_CACHE_DIR
+        self.directory = Path(base_dir) / namespace
+        self.ttl = ttl
+        self.compress = compress
+
+    def _path(self, key: str) -> Path:
+        """Return the file used to store a key."""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        suffix = '.json.gz' if self.compress else '.json'
+        return self.directory / f"{digest}{suffix}"
+    
+    def _open(self, path: Path, mode: str):
+        """Open a cache file for text I/O, compressed if configured."""
+        if self.compress:
+            return gzip.open(path, mode + 't', encoding='utf-8')
+        return open(path, mode, encoding='utf-8')
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the cached value for a key.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+
+        Returns:
+            Cached value or ``default``
+        """
+        try:
+            with self._open(self._path(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, EOFError, ValueError):
+            return default
+
+        expires = entry.get('expires')
+        if expires is not None and expires < time.time():
+            return default
+        return entry.get('value', default)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value for a key.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time-to-live in seconds, overriding the cache default
+        """
+        ttl = self.ttl if ttl is None else ttl
+        entry = {
+            'expires': time.time() + ttl if ttl is not None else None,
+            'value': value
+        }
+
+        path = self._path(key)
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per write, since threads may store the same key at once
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp', delete=False) as tmp:
+                tmp_path = tmp.name
+            with self._open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Could not write cache entry: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -6,16 +6,26 @@ Command-line interface for GitHub Contributions Tracker
 import os
 import sys
 import argparse
-from datetime import datetime, timezone
-from dateutil import parser as date_parser
+import logging
+from datetime import datetime, timedelta, timezone
 
-from .tracker import GitHubContributionsTracker
+from .bedrock_summarizer import DEFAULT_MODEL_ID
+from .cache import DiskCache
+from .tracker import CommitRec, GitHubContributionsTracker
+
+# Fetched contributions are reused for a day
+CONTRIBUTIONS_CACHE_TTL = 24 * 60 * 60
 
 
 def parse_date(date_str: str) -> datetime:
     """Parse date string in various formats."""
     try:
-        parsed_date = date_parser.parse(date_str)
+        try:
+            # Fast path for ISO dates such as YYYY-MM-DD
+            parsed_date = datetime.fromisoformat(date_str)
+        except ValueError:
+            from dateutil import parser as date_parser
+            parsed_date = date_parser.parse(date_str)
         # Make sure the datetime is timezone-aware
         if parsed_date.tzinfo is None:
             parsed_date = parsed_date.replace(tzinfo=timezone.utc)
@@ -24,6 +34,44 @@ def parse_date(date_str: str) -> datetime:
         raise argparse.ArgumentTypeError(f"Invalid date format: {date_str}")
 
 
+def split_date_range(start_date: datetime, end_date: datetime, unit: str):
+    """Split a date range into consecutive weekly or monthly windows."""
+    windows = []
+    current_date = start_date
+    while current_date < end_date:
+        if unit == 'week':
+            next_date = current_date + timedelta(days=7)
+        else:
+            # First day of the following month
+            next_date = (current_date.replace(day=1) + timedelta(days=32)).replace(day=1)
+        windows.append((current_date, min(next_date, end_date)))
+        current_date = next_date
+    return windows
+
+
+def _contributions_cache_key(login: str, start_date: datetime, end_date: datetime, args) -> str:
+    """Build the cache key for one contributions fetch, keyed on the resolved GitHub login."""
+    return ":".join(str(part) for part in (
+        login, start_date.isoformat(), end_date.isoformat(), args.include_private,
+        not args.no_optimize, args.limit, args.graphql, args.bulk, args.conservative
+    ))
+
+
+def _serialize_contributions(contributions):
+    """Convert contributions into JSON-serializable data."""
+    data = dict(contributions)
+    data['commits'] = [dict(commit._asdict(), date=commit.date.isoformat()) for commit in contributions['commits']]
+    return data
+
+
+def _deserialize_contributions(data):
+    """Restore contributions loaded from the cache."""
+    contributions = dict(data)
+    contributions['commits'] = [CommitRec(**dict(commit, date=datetime.fromisoformat(commit['date'])))
+                                for commit in data['commits']]
+    return contributions
+
+
 def main():
     """Main CLI function."""
     parser = argparse.ArgumentParser(description='Track GitHub contributions for a time range')
@@ -49,55 +97,145 @@ def main():
                        help='Print to console only, don\'t save to file')
     parser.add_argument('--format', '-f', choices=['markdown', 'plain'], default='markdown',
                        help='Output format: markdown or plain text')
-    parser.add_argument('--username', '-u', help='GitHub username to track (default: authenticated user)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Show every commit while fetching')
+    parser.add_argument('--username', '-u', action='append',
+                       help='GitHub username to track (default: authenticated user). Repeat to track several users')
+    parser.add_argument('--split-by', choices=['week', 'month'],
+                       help='Split the date range into weekly or monthly windows, each summarized separately')
     parser.add_argument('--bedrock', action='store_true',
                        help='Use Amazon Bedrock to generate an AI-powered summary of contributions')
-    parser.add_argument('--bedrock-model', default='anthropic.claude-3-sonnet-20240229-v1:0',
+    parser.add_argument('--bedrock-model', default=DEFAULT_MODEL_ID,
                        help='Bedrock model ID to use for summarization')
     parser.add_argument('--bedrock-region', default='us-east-1',
                        help='AWS region for Bedrock service')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write cached results in ~/.cache/ghct')
+    parser.add_argument('--concurrency', type=int, default=10,
+                       help='Maximum concurrent Bedrock requests when summarizing several users or windows')
+    parser.add_argument('--bedrock-batch-bucket',
+                       help='S3 bucket for Bedrock batch inference when summarizing several users or windows')
+    parser.add_argument('--bedrock-batch-prefix', default='github-contributions-tracker',
+                       help='S3 key prefix for Bedrock batch inference files')
+    parser.add_argument('--bedrock-role-arn',
+                       help='IAM role ARN Bedrock assumes to read and write the batch bucket')
     
     args = parser.parse_args()
     
+    # Progress goes to stdout alongside the print() output it interleaves with,
+    # and only this package's loggers are raised above WARNING
+    logging.basicConfig(format='%(message)s', stream=sys.stdout)
+    logging.getLogger(__package__).setLevel(logging.DEBUG if args.verbose else logging.INFO)
+    
     # Validate date range
     if args.start_date >= args.end_date:
         print("Error: Start date must be before end date")
         sys.exit(1)
     
+    if args.bedrock_batch_bucket and not args.bedrock_role_arn:
+        parser.error("--bedrock-batch-bucket requires --bedrock-role-arn")
+    
     try:
-        # Initialize tracker
-        tracker = GitHubContributionsTracker(args.token, args.username)
-        
-        print(f"Fetching contributions from {args.start_date.date()} to {args.end_date.date()}...")
+        usernames = args.username or [None]
+        if args.split_by:
+            windows = split_date_range(args.start_date, args.end_date, args.split_by)
+        else:
+            windows = [(args.start_date, args.end_date)]
         
         # Apply fast mode settings
         skip_reviews = args.skip_reviews or args.fast
         
-        # Get contributions
-        contributions = tracker.get_contributions(
-            args.start_date, 
-            args.end_date, 
-            args.include_private,
-            optimize=not args.no_optimize,
-            limit=args.limit,
-            skip_reviews=skip_reviews,
-            use_graphql=args.graphql,
-            use_bulk=args.bulk,
-            use_conservative=args.conservative
-        )
+        cache = None if args.no_cache else DiskCache('contributions', ttl=CONTRIBUTIONS_CACHE_TTL)
+        
+        # Fetch contributions for every user and date window
+        runs = []
+        for username in usernames:
+            # Initialize tracker
+            tracker = GitHubContributionsTracker(args.token, username, use_cache=not args.no_cache)
+            
+            for start_date, end_date in windows:
+                cache_key = _contributions_cache_key(tracker.login, start_date, end_date, args)
+                cached = cache.get(cache_key) if cache else None
+                
+                if cached is not None:
+                    print(f"Using cached contributions from {start_date.date()} to {end_date.date()}")
+                    contributions = _deserialize_contributions(cached)
+                else:
+                    print(f"Fetching contributions from {start_date.date()} to {end_date.date()}...")
+                    
+                    # Get contributions
+                    contributions = tracker.get_contributions(
+                        start_date, 
+                        end_date, 
+                        args.include_private,
+                        optimize=not args.no_optimize,
+                        limit=args.limit,
+                        skip_reviews=skip_reviews,
+                        use_graphql=args.graphql,
+                        use_bulk=args.bulk,
+                        use_conservative=args.conservative
+                    )
+                    if cache:
+                        cache.set(cache_key, _serialize_contributions(contributions))
+                label = f"{username or tracker.login}: {start_date.date()} to {end_date.date()}"
+                runs.append((label, contributions))
+        
+        if args.bedrock and args.print_only and len(runs) == 1:
+            # Stream the AI summary to the console as it is generated
+            for text in tracker.stream_bedrock_summary(
+                runs[0][1],
+                model_id=args.bedrock_model,
+                region=args.bedrock_region,
+                use_cache=not args.no_cache
+            ):
+                print(text, end='', flush=True)
+            print()
+            return
+        
+        if not args.bedrock and not args.repos_only and len(runs) == 1:
+            # Stream the regular summary to the file and console instead of building one string
+            contributions = runs[0][1]
+            if not args.print_only:
+                tracker.save_summary_iter(tracker.iter_summary(contributions, args.format), args.output)
+                print()
+            sys.stdout.writelines(tracker.iter_summary(contributions, args.format))
+            print()
+            return
         
         # Generate summary
         if args.bedrock:
             # Use Bedrock for AI-powered summarization
-            summary = tracker.generate_bedrock_summary(
-                contributions, 
-                model_id=args.bedrock_model,
-                region=args.bedrock_region
-            )
+            if len(runs) == 1:
+                summaries = [tracker.generate_bedrock_summary(
+                    runs[0][1], 
+                    model_id=args.bedrock_model,
+                    region=args.bedrock_region,
+                    use_cache=not args.no_cache
+                )]
+            else:
+                summaries = tracker.generate_bedrock_summaries(
+                    [contributions for _, contributions in runs],
+                    model_id=args.bedrock_model,
+                    region=args.bedrock_region,
+                    s3_bucket=args.bedrock_batch_bucket,
+                    s3_prefix=args.bedrock_batch_prefix,
+                    role_arn=args.bedrock_role_arn,
+                    max_concurrency=args.concurrency,
+                    use_cache=not args.no_cache
+                )
         elif args.repos_only:
-            summary = tracker.generate_repos_only_summary(contributions, args.format)
+            summaries = [tracker.generate_repos_only_summary(contributions, args.format) for _, contributions in runs]
         else:
-            summary = tracker.generate_summary(contributions, args.format)
+            summaries = [tracker.generate_summary(contributions, args.format) for _, contributions in runs]
+        
+        if len(runs) == 1:
+            summary = summaries[0]
+        else:
+            # Title each section with the user and date window it covers
+            summary = "\n\n".join(
+                f"{label}\n{'=' * len(label)}\n\n{section}"
+                for (label, _), section in zip(runs, summaries)
+            )
         
         # Output
         if args.print_only:
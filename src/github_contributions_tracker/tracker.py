@@ -3,23 +3,166 @@
 GitHub Contributions Tracker main module
 """
 
+import io
 import os
+import re
 import sys
 import json
-from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any
+import logging
+import heapq
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import groupby, islice
+from operator import attrgetter
+from typing import List, Dict, Any, Iterable, Iterator, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
 import requests
-from dateutil import parser as date_parser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from github import Github
 from github.Repository import Repository
 from github.PullRequest import PullRequest
 from github.Commit import Commit
 
-from .bedrock_summarizer import BedrockSummarizer
+from .bedrock_summarizer import DEFAULT_MODEL_ID
+from .cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+REST_API_URL = "https://api.github.com"
+
+# One aliased repository in the combined commits query; formatted with alias, owner, name and after
+_COMMITS_REPOSITORY_TEMPLATE = """
+    {alias}: repository(owner: {owner}, name: {name}) {{
+        isPrivate
+        defaultBranchRef {{
+            target {{
+                ... on Commit {{
+                    history(since: $since, until: $until, first: 100{after}) {{
+                        nodes {{
+                            oid
+                            messageHeadline
+                            committedDate
+                            url
+                            author {{
+                                user {{
+                                    login
+                                }}
+                            }}
+                        }}
+                        pageInfo {{
+                            endCursor
+                            hasNextPage
+                        }}
+                    }}
+                }}
+            }}
+        }}
+    }}"""
+
+# Wraps the aliased repositories of one commits request
+_COMMITS_QUERY_PREFIX = "query($since: GitTimestamp!, $until: GitTimestamp!) {"
+_COMMITS_QUERY_SUFFIX = "\n}"
+
+# One aliased repository in the visibility lookup; formatted with alias, owner and name
+_PRIVACY_REPOSITORY_TEMPLATE = "{alias}: repository(owner: {owner}, name: {name}) {{ isPrivate }}"
+
+# Repository full name (owner/repo) in a commit URL such as https://github.com/owner/repo/commit/sha
+_REPO_URL_RE = re.compile(r"github\.com/([^/]+/[^/]+)/commit/")
+
+# Maximum number of repositories fetched concurrently over REST
+MAX_REPO_WORKERS = 20
+
+# Maximum number of search result pages fetched concurrently
+MAX_SEARCH_PAGE_WORKERS = 10
+
+# How long cached search results for ranges that include today stay fresh
+SEARCH_CACHE_TTL = 60 * 60
+
+# Requests left in the current rate limit window below which the tracker waits for the reset
+RATE_LIMIT_THRESHOLD = 10
+
+# GitHub allows 30 search requests per minute for authenticated users
+SEARCH_RATE_LIMIT = (30, 60)
+
+# Maximum number of weekly chunks searched concurrently by the conservative approach
+MAX_CHUNK_WORKERS = 5
+
+# Repository visibility labels, indexed by the repository's private flag
+_VIS_MD = ("🌐 Public", "🔒 Private")
+_VIS_TXT = ("Public", "Private")
+
+# Static section headers of the generated summaries
+_MD_HEADER = "# GitHub Contributions Summary\n\n## Overview"
+_PLAIN_RULE_40 = "=" * 40
+_PLAIN_HEADER = f"GITHUB CONTRIBUTIONS SUMMARY\n{_PLAIN_RULE_40}\n\nOVERVIEW\n{'-' * 10}"
+_PLAIN_COMMITS_HDR = f"COMMITS\n{'-' * 10}"
+_PLAIN_REPOS_HDR = f"REPOSITORIES WITH CONTRIBUTIONS\n{'-' * 32}"
+_MD_REPOS_ONLY_HEADER = "# Repositories with Contributions\n"
+_PLAIN_REPOS_ONLY_HEADER = f"REPOSITORIES WITH CONTRIBUTIONS\n{_PLAIN_RULE_40}\n"
+_PLAIN_REPO_LIST_HDR = f"REPOSITORY LIST\n{'-' * 15}"
+
+# Complete summaries for date ranges without any activity
+_EMPTY_MD = f"{_MD_HEADER}\n- **Total Commits**: 0\n- **Repositories with Contributions**: 0\n"
+_EMPTY_TXT = f"{_PLAIN_HEADER}\nTotal Commits: 0\nRepositories with Contributions: 0\n"
+_EMPTY_REPOS_ONLY_MD = f"{_MD_REPOS_ONLY_HEADER}\n**Total Repositories**: 0\n"
+_EMPTY_REPOS_ONLY_TXT = f"{_PLAIN_REPOS_ONLY_HEADER}\nTotal Repositories: 0\n"
+
+# Most recent commits listed in the Bedrock prompt; the low-level tasks section
+# added to the AI summary still lists every commit
+BEDROCK_PROMPT_COMMITS = 200
+
+
+def _parse_github_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp such as 2024-01-02T10:00:00Z from the GitHub API."""
+    # fromisoformat only accepts the Z suffix from Python 3.11
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+class CommitRec(NamedTuple):
+    """A commit found for the tracked user."""
+    repo: str
+    sha: str
+    message: str
+    date: datetime
+    url: str
+
+
+def _format_repo_block(repo_name: str, commits: Iterable[CommitRec]) -> str:
+    """Format one repository's commits for the low-level tasks section."""
+    return f"  Repository: {repo_name}\n" + '\n'.join([f"    Commit: {sha} - {message}" for _, sha, message, _, _ in commits])
+
+
+class _RateLimiter:
+    """Token bucket allowing ``rate`` calls per ``period`` seconds, shared between threads."""
+    
+    def __init__(self, rate: int, period: float):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a call is allowed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.period / self.rate
+            time.sleep(wait)
 
 
 class GitHubContributionsTracker:
-    def __init__(self, token: str = None, username: str = None):
+    def __init__(self, token: str = None, username: str = None, use_cache: bool = False):
         """Initialize the tracker with GitHub token."""
         self.token = token or os.getenv('GITHUB_TOKEN')
         if not self.token:
@@ -27,6 +170,27 @@ class GitHubContributionsTracker:
         
         self.github = Github(self.token)
         
+        # Persistent keep-alive session for all direct GraphQL and REST requests
+        self._session = requests.Session()
+        self._session.headers.update({
+            'Authorization': f'bearer {self.token}',
+            'Accept': 'application/vnd.github+json',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        # Retry transient gateway errors; GraphQL queries are safe to resend
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                      allowed_methods=frozenset(['GET', 'POST']))
+        adapter = HTTPAdapter(pool_connections=MAX_REPO_WORKERS, pool_maxsize=MAX_REPO_WORKERS,
+                              max_retries=retry)
+        self._session.mount('https://', adapter)
+        
+        # Commit search results, revalidated with ETags once stale
+        self._search_cache = DiskCache('search', compress=True) if use_cache else None
+        # REST responses kept with their ETags for conditional requests
+        self._http_cache = DiskCache('http', compress=True) if use_cache else None
+        # Search has its own, much lower, rate limit
+        self._search_limiter = _RateLimiter(*SEARCH_RATE_LIMIT)
+        
         # If username is provided, get that user, otherwise get authenticated user
         if username:
             self.user = self.github.get_user(username)
@@ -34,6 +198,9 @@ class GitHubContributionsTracker:
         else:
             self.user = self.github.get_user()
             print(f"Tracking contributions for authenticated user: {self.user.login}")
+        
+        # Read once, since PyGithub may lazily fetch the user again on attribute access
+        self.login = self.user.login
     
     def get_contributions(self, start_date: datetime, end_date: datetime, 
                          include_private: bool = True, optimize: bool = True, limit: int = None, 
@@ -88,61 +255,272 @@ class GitHubContributionsTracker:
             return self._fetch_contributions_graphql(repos_with_contributions, start_date, end_date)
         
         print("Processing repositories...")
-        for i, repo_name in enumerate(repos_with_contributions, 1):
-            try:
-                print(f"  Processing repository {i}/{len(repos_with_contributions)}: {repo_name}")
-                # Get the repository object
-                repo = self.github.get_repo(repo_name)
-                
-                # Get commits
-                commits = repo.get_commits(since=start_date, until=end_date, author=self.user)
-                if commits.totalCount > 0:
-                    print(f"    Found {commits.totalCount} commits")
-                    # Limit to first 50 commits per repo for performance
-                    commit_count = 0
-                    for commit in commits:
-                        if commit_count >= 50:  # Limit commits per repo
-                            break
-                        # Ensure commit date is timezone-aware
-                        commit_date = commit.commit.author.date
-                        if commit_date.tzinfo is None:
-                            commit_date = commit_date.replace(tzinfo=timezone.utc)
-                        
-                        commit_data = {
-                            'repo': repo.name,
-                            'sha': commit.sha[:7],
-                            'message': commit.commit.message.split('\n')[0],  # First line only
-                            'date': commit_date,
-                            'url': commit.html_url
-                        }
-                        contributions['commits'].append(commit_data)
-                        print(f"      Commit: {commit_data['sha']} - {commit_data['message']}")
-                        commit_count += 1
-                
-                # Add repository to list
-                contributions['repositories'].append({
-                    'name': repo.name,
-                    'url': repo.html_url,
-                    'private': repo.private
-                })
-                
-            except Exception as e:
-                print(f"Error processing repository {repo_name}: {e}")
+        # Limit to first 50 commits per repo for performance
+        results = self._fetch_repos_commits(repos_with_contributions, start_date, end_date, max_commits=50)
+        for i, (repo_name, result) in enumerate(zip(repos_with_contributions, results), 1):
+            print(f"  Processing repository {i}/{len(repos_with_contributions)}: {repo_name}")
+            if isinstance(result, Exception):
+                print(f"Error processing repository {repo_name}: {result}")
                 continue
+            
+            repository, commits = result
+            if commits:
+                print(f"    Found {len(commits)} commits")
+                for commit_data in commits:
+                    contributions['commits'].append(commit_data)
+                    logger.debug("      Commit: %s - %s", commit_data.sha, commit_data.message)
+            
+            # Add repository to list
+            contributions['repositories'].append(repository)
         
         print(f"Completed processing {len(contributions['repositories'])} repositories")
         
-        # Print summary of all commits found
-        if contributions['commits']:
-            print(f"\n📊 COMMIT SUMMARY:")
-            print(f"Total commits found: {len(contributions['commits'])}")
-            print(f"Repositories with commits: {len(set(commit['repo'] for commit in contributions['commits']))}")
-            print(f"\nAll commits:")
-            for commit in contributions['commits']:
-                print(f"  {commit['repo']}: {commit['sha']} - {commit['message']}")
+        self._print_summary(contributions)
         
         return contributions
     
+    def _get_json(self, url: str, params: Dict[str, Any] = None) -> Tuple[Any, Dict[str, Any]]:
+        """
+        GET a GitHub REST resource, revalidating any cached copy with its ETag.
+        
+        A ``304 Not Modified`` answer does not count against the rate limit,
+        so unchanged resources are free to fetch again.
+        
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+            
+        Returns:
+            Tuple of the decoded JSON body and the parsed ``Link`` header
+        """
+        entry = None
+        if self._http_cache is not None:
+            key = requests.Request('GET', url, params=params).prepare().url
+            entry = self._http_cache.get(key)
+        
+        headers = {'If-None-Match': entry['etag']} if entry else {}
+        response = self._session.get(url, params=params, headers=headers)
+        self._respect_rate_limits(response)
+        
+        if entry and response.status_code == 304:
+            return entry['data'], entry['links']
+        response.raise_for_status()
+        
+        data = response.json()
+        etag = response.headers.get('ETag')
+        if self._http_cache is not None and etag:
+            self._http_cache.set(key, {'etag': etag, 'data': data, 'links': response.links})
+        return data, response.links
+    
+    def _respect_rate_limits(self, response: requests.Response):
+        """
+        Wait for the rate limit window to reset when almost no requests are left.
+        
+        Args:
+            response: Response whose ``X-RateLimit-*`` headers describe the current quota
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is None or int(remaining) >= RATE_LIMIT_THRESHOLD:
+            return
+        
+        delay = int(response.headers.get('X-RateLimit-Reset', 0)) - time.time()
+        if delay > 0:
+            print(f"Rate limit nearly exhausted ({remaining} requests left), waiting {int(delay)}s for reset...")
+            time.sleep(delay)
+    
+    def _print_summary(self, contributions: Dict[str, List[Any]]):
+        """Print the totals and the list of all commits found by a fetch."""
+        commits = contributions['commits']
+        if not commits:
+            return
+        
+        # One pass collects both the repository set and the listing
+        repos = set()
+        lines = []
+        for commit in commits:
+            repos.add(commit.repo)
+            lines.append(f"  {commit.repo}: {commit.sha} - {commit.message}")
+        
+        print(f"\n📊 COMMIT SUMMARY:")
+        print(f"Total commits found: {len(commits)}")
+        print(f"Repositories with commits: {len(repos)}")
+        logger.info("\nAll commits:\n%s", "\n".join(lines))
+    
+    def _iter_github_items(self, url: str, params: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the items of a paginated GitHub REST list endpoint.
+        
+        Pages are requested only as the caller consumes items, following the
+        ``Link: rel="next"`` header.
+        
+        Args:
+            url: Endpoint URL
+            params: Query parameters for the first page
+            
+        Yields:
+            Decoded JSON items
+        """
+        while url:
+            items, links = self._get_json(url, params)
+            yield from items
+            
+            # The next link already carries the query string
+            url = links.get('next', {}).get('url')
+            params = None
+    
+    def _fetch_repo_commits(self, repo_name: str, start_date: datetime, end_date: datetime,
+                            max_commits: int = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Fetch a repository and the user's commits in it over REST.
+        
+        Args:
+            repo_name: Repository full name (owner/repo)
+            start_date: Start date for contributions
+            end_date: End date for contributions
+            max_commits: Maximum number of commits to return, or None for all
+            
+        Returns:
+            Tuple of the repository entry and the list of commits
+        """
+        repo, _ = self._get_json(f"{REST_API_URL}/repos/{repo_name}")
+        
+        repository = {
+            'name': repo['name'],
+            'url': repo['html_url'],
+            'private': repo['private']
+        }
+        
+        params = {
+            'author': self.login,
+            'since': start_date.isoformat(),
+            'until': end_date.isoformat(),
+            # Don't download more of the first page than will be used
+            'per_page': min(max_commits, 100) if max_commits else 100
+        }
+        commits = []
+        # Stopping the generator early means later pages are never requested
+        items = self._iter_github_items(f"{REST_API_URL}/repos/{repo_name}/commits", params)
+        for commit in islice(items, max_commits):
+            commits.append(CommitRec(
+                repo=repo['name'],
+                sha=commit['sha'][:7],
+                message=commit['commit']['message'].partition('\n')[0],  # First line only
+                date=_parse_github_timestamp(commit['commit']['author']['date']),
+                url=commit['html_url']
+            ))
+        
+        return repository, commits
+    
+    def _fetch_repos_commits(self, repo_names: List[str], start_date: datetime, end_date: datetime,
+                             max_commits: int = None) -> List[Any]:
+        """
+        Fetch several repositories and their commits concurrently.
+        
+        Args:
+            repo_names: Repository full names (owner/repo)
+            start_date: Start date for contributions
+            end_date: End date for contributions
+            max_commits: Maximum number of commits per repository, or None for all
+            
+        Returns:
+            For each repository, in order, the result of ``_fetch_repo_commits`` or the exception it raised
+        """
+        def fetch(repo_name):
+            try:
+                return self._fetch_repo_commits(repo_name, start_date, end_date, max_commits)
+            except Exception as e:
+                return e
+        
+        if not repo_names:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_REPO_WORKERS, len(repo_names))) as executor:
+            return list(executor.map(fetch, repo_names))
+    
+    def _search_commits(self, query: str, etag: str = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        Run a commit search over REST, reading every result page.
+        
+        Args:
+            query: GitHub commit search query
+            etag: ETag of a previous result, sent as ``If-None-Match``
+            
+        Returns:
+            Tuple of the matching commits (None if unchanged since ``etag``) and the response ETag
+        """
+        headers = {'If-None-Match': etag} if etag else {}
+        self._search_limiter.acquire()
+        response = self._session.get(f"{REST_API_URL}/search/commits",
+                                     params={'q': query, 'per_page': 100}, headers=headers)
+        self._respect_rate_limits(response)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        
+        items = response.json()['items']
+        etag = response.headers.get('ETag')
+        
+        # The last link tells how many pages there are, so fetch the rest concurrently
+        last_url = response.links.get('last', {}).get('url')
+        if last_url:
+            last_page = int(parse_qs(urlsplit(last_url).query)['page'][0])
+            
+            def fetch_page(page_number):
+                self._search_limiter.acquire()
+                page = self._session.get(f"{REST_API_URL}/search/commits",
+                                         params={'q': query, 'per_page': 100, 'page': page_number})
+                self._respect_rate_limits(page)
+                page.raise_for_status()
+                return page.json()['items']
+            
+            with ThreadPoolExecutor(max_workers=min(MAX_SEARCH_PAGE_WORKERS, last_page - 1)) as executor:
+                for page_items in executor.map(fetch_page, range(2, last_page + 1)):
+                    items.extend(page_items)
+        
+        # Keep only the fields the tracker reads, so cache entries stay small
+        commits = [{
+            'sha': item['sha'],
+            'html_url': item['html_url'],
+            'commit': {
+                'message': item['commit']['message'],
+                'author': {'date': item['commit']['author']['date']}
+            }
+        } for item in items]
+        return commits, etag
+    
+    def _search_ttl(self, end_date: datetime) -> Optional[float]:
+        """Return how long search results for a range stay fresh, or None if they never change."""
+        now = datetime.now(end_date.tzinfo) if end_date.tzinfo else datetime.now()
+        return SEARCH_CACHE_TTL if end_date.date() >= now.date() else None
+    
+    def _cached_search(self, query: str, ttl: Optional[float]) -> List[Dict[str, Any]]:
+        """
+        Run a commit search, reusing results cached on disk.
+        
+        Fresh entries are returned without a request. Stale entries are
+        revalidated with their ETag, which costs no rate limit when GitHub
+        answers 304 Not Modified.
+        
+        Args:
+            query: GitHub commit search query
+            ttl: Seconds a cached result stays fresh, or None to never expire
+            
+        Returns:
+            List of matching commits
+        """
+        if self._search_cache is None:
+            return self._search_commits(query)[0]
+        
+        entry = self._search_cache.get(query)
+        if entry is not None and (ttl is None or time.time() - entry['fetched'] < ttl):
+            return entry['items']
+        
+        commits, etag = self._search_commits(query, entry['etag'] if entry else None)
+        if commits is None:
+            commits = entry['items']
+        self._search_cache.set(query, {'fetched': time.time(), 'etag': etag, 'items': commits})
+        return commits
+    
     def _get_repos_with_contributions(self, start_date: datetime, end_date: datetime, 
                                     include_private: bool = False) -> List[str]:
         """
@@ -164,40 +542,25 @@ class GitHubContributionsTracker:
         end_date_str = end_date.strftime("%Y-%m-%d")
         
         try:
-            # Search for commits by the user
-            commit_query = f'author:{self.user.login} committer-date:{start_date_str}..{end_date_str}'
-            commits = self.github.search_commits(query=commit_query)
+            # Search for commits by the user, letting GitHub drop private repositories
+            commit_query = f'author:{self.login} committer-date:{start_date_str}..{end_date_str}'
+            if not include_private:
+                commit_query += ' is:public'
+            commits = self._cached_search(commit_query, self._search_ttl(end_date))
             
-            print(f"Found {commits.totalCount} commits in search")
+            print(f"Found {len(commits)} commits in search")
             
             for commit in commits:
                 # Extract repository name from commit URL
                 # URL format: https://github.com/owner/repo/commit/sha
-                url_parts = commit.html_url.split('/')
-                if len(url_parts) >= 5:
-                    repo_name = f"{url_parts[3]}/{url_parts[4]}"
-                    repos_with_contributions.add(repo_name)
-            
-
+                match = _REPO_URL_RE.search(commit['html_url'])
+                if match:
+                    repos_with_contributions.add(match.group(1))
             
             # Note: GitHub search API doesn't directly support PR reviews
             # We'll need to check repositories found through other means for reviews
             
-            # Filter out private repositories if not included
-            if not include_private:
-                filtered_repos = set()
-                for repo_name in repos_with_contributions:
-                    try:
-                        repo = self.github.get_repo(repo_name)
-                        if not repo.private:
-                            filtered_repos.add(repo_name)
-                    except Exception:
-                        # If we can't access the repo, skip it (likely private)
-                        continue
-                repos_with_contributions = filtered_repos
-                print(f"After filtering private repos: {len(repos_with_contributions)} repositories")
-            else:
-                print(f"Total repositories found: {len(repos_with_contributions)}")
+            print(f"Total repositories found: {len(repos_with_contributions)}")
             
         except Exception as e:
             print(f"Warning: Could not use search API optimization: {e}")
@@ -213,7 +576,8 @@ class GitHubContributionsTracker:
     def _fetch_contributions_graphql(self, repos_with_contributions: List[str], start_date: datetime, end_date: datetime) -> Dict[str, List[Any]]:
         """
         Fetch contributions using GraphQL API for better performance.
-        This method batches multiple queries and reduces API calls significantly.
+        Each request aliases up to 20 repositories into a single query and
+        follows the commit history cursors until every repository is exhausted.
         """
         contributions = {
             'commits': [],
@@ -229,199 +593,112 @@ class GitHubContributionsTracker:
         
         print("Using GraphQL API for efficient data fetching...")
         
-        # Process repositories in batches of 5 to avoid rate limits
-        batch_size = 5
-        for i in range(0, len(repos_with_contributions), batch_size):
-            batch = repos_with_contributions[i:i + batch_size]
-            print(f"Processing batch {i//batch_size + 1}/{(len(repos_with_contributions) + batch_size - 1)//batch_size}")
+        variables = {
+            "since": start_date_str,
+            "until": end_date_str
+        }
+        
+        login = self.login
+        
+        # Aliases still to fetch, mapped to (repo_name, history cursor)
+        pending = {f"r{i}": (repo_name, None) for i, repo_name in enumerate(repos_with_contributions)
+                   if '/' in repo_name}
+        
+        # Stay well under GitHub's node limit per request
+        batch_size = 20
+        request_count = 0
+        while pending:
+            batch = list(pending.items())[:batch_size]
+            request_count += 1
+            print(f"Processing GraphQL request {request_count} ({len(batch)} repositories, {len(pending)} pending)")
+            
+            aliases = []
+            for alias, (repo_name, cursor) in batch:
+                owner, repo = repo_name.split('/', 1)
+                aliases.append(_COMMITS_REPOSITORY_TEMPLATE.format(
+                    alias=alias,
+                    owner=json.dumps(owner),
+                    name=json.dumps(repo),
+                    after=f", after: {json.dumps(cursor)}" if cursor else ""
+                ))
+            query = _COMMITS_QUERY_PREFIX + "".join(aliases) + _COMMITS_QUERY_SUFFIX
             
-            for repo_name in batch:
+            try:
+                response = self._session.post(GRAPHQL_URL, json={"query": query, "variables": variables})
+                self._respect_rate_limits(response)
+                response.raise_for_status()
+                result = response.json()
+            except Exception as e:
+                # Only this batch is lost; the other pending repositories are still fetched
+                skipped = [repo_name for _, (repo_name, _) in batch]
+                print(f"    Error making GraphQL request for {', '.join(skipped)}: {e}")
+                for alias, _ in batch:
+                    del pending[alias]
+                continue
+            
+            # Partial errors (e.g. an inaccessible repository) still return data for the other aliases
+            if result.get("errors"):
+                print(f"    Warning: GraphQL errors: {result['errors']}")
+            data = result.get("data") or {}
+            
+            for alias, (repo_name, cursor) in batch:
+                del pending[alias]
+                owner, repo = repo_name.split('/', 1)
+                
                 try:
-                    # Extract owner and repo name
-                    owner, repo = repo_name.split('/', 1)
-                    
-                    # GraphQL query for commits
-                    commits_query = """
-                    query($owner: String!, $repo: String!, $since: GitTimestamp!, $until: GitTimestamp!) {
-                        repository(owner: $owner, name: $repo) {
-                            defaultBranchRef {
-                                target {
-                                    ... on Commit {
-                                        history(since: $since, until: $until, first: 50) {
-                                            nodes {
-                                                oid
-                                                messageHeadline
-                                                committedDate
-                                                url
-                                                author {
-                                                    user {
-                                                        login
-                                                    }
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    """
-                    
-                    # GraphQL query for pull requests
-                    prs_query = """
-                    query($owner: String!, $repo: String!, $author: String!, $since: DateTime!, $until: DateTime!) {
-                        repository(owner: $owner, name: $repo) {
-                            pullRequests(first: 20, orderBy: {field: CREATED_AT, direction: DESC}) {
-                                nodes {
-                                    number
-                                    title
-                                    state
-                                    createdAt
-                                    mergedAt
-                                    url
-                                    author {
-                                        login
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    """
-                    
-                    # GraphQL query for issues
-                    issues_query = """
-                    query($owner: String!, $repo: String!, $author: String!, $since: DateTime!, $until: $until) {
-                        repository(owner: $owner, name: $repo) {
-                            issues(first: 20, orderBy: {field: CREATED_AT, direction: DESC}) {
-                                nodes {
-                                    number
-                                    title
-                                    state
-                                    createdAt
-                                    url
-                                    author {
-                                        login
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    """
-                    
-                    # Execute queries
-                    variables = {
-                        "owner": owner,
-                        "repo": repo,
-                        "since": start_date_str,
-                        "until": end_date_str
-                    }
-                    
-                    # Get commits
-                    try:
-                        commits_result = self.github._Github__requester.requestJson("POST", "/graphql", 
-                            input={"query": commits_query, "variables": variables})
-                        
-                    except Exception as e:
-                        print(f"    Error making GraphQL request for {repo_name}: {e}")
+                    repo_data = data.get(alias)
+                    if not repo_data:
+                        print(f"    Warning: No repository data for {repo_name}, skipping...")
                         continue
                     
-                    # Handle different response types
-                    if isinstance(commits_result, tuple):
-                        # GraphQL returns (status_code, headers, response_body)
-                        status_code, headers, response_body = commits_result
-                        
-                        if status_code != 200:
-                            print(f"    Warning: GraphQL returned status {status_code} for {repo_name}, skipping...")
-                            continue
-                        
-                        # Parse the response body
-                        try:
-                            if isinstance(response_body, str):
-                                import json
-                                commits_result = json.loads(response_body)
-                            else:
-                                commits_result = response_body
-                        except Exception as e:
-                            print(f"    Error parsing GraphQL response for {repo_name}: {e}")
-                            continue
-                            
-                    elif isinstance(commits_result, int):
-                        print(f"    Warning: GraphQL returned integer response for {repo_name}: {commits_result}, skipping...")
-                        continue
-                    elif not isinstance(commits_result, dict):
-                        print(f"    Warning: GraphQL returned unexpected response type for {repo_name}: {type(commits_result)} = {commits_result}, skipping...")
+                    default_branch = repo_data.get("defaultBranchRef")
+                    if not default_branch:
+                        print(f"    Warning: No default branch for {repo_name}, skipping...")
                         continue
                     
-                    # Check for GraphQL errors
-                    if commits_result.get("errors"):
-                        print(f"    Warning: GraphQL errors for {repo_name}: {commits_result['errors']}")
+                    target = default_branch.get("target")
+                    if not target or "history" not in target:
+                        print(f"    Warning: No commit history for {repo_name}, skipping...")
                         continue
                     
-                    # Process commits if we have valid data
-                    try:
-                        repo_data = commits_result.get("data", {}).get("repository")
-                        if not repo_data:
-                            print(f"    Warning: No repository data for {repo_name}, skipping...")
-                            continue
-
-                        default_branch = repo_data.get("defaultBranchRef")
-                        if not default_branch:
-                            print(f"    Warning: No default branch for {repo_name}, skipping...")
-                            continue
-
-                        target = default_branch.get("target")
-                        if not target or "history" not in target:
-                            print(f"    Warning: No commit history for {repo_name}, skipping...")
-                            continue
-
-                        commits_data = target["history"]["nodes"]
+                    history = target["history"]
+                    if cursor is None:
                         print(f"  Repository: {repo_name}")
-                        for commit in commits_data:
-                            # Filter by author
-                            author = commit.get('author')
-                            if not author or not author.get('user') or not author['user'].get('login'):
-                                continue  # Skip commits with missing author info
-                            author_login = author['user']['login']
-                            if author_login != self.user.login:
-                                continue
-                                
-                            commit_data = {
-                                'repo': repo,
-                                'sha': commit['oid'][:7],
-                                'message': commit['messageHeadline'],
-                                'date': date_parser.parse(commit['committedDate']),
-                                'url': commit['url']
-                            }
-                            contributions['commits'].append(commit_data)
-                            print(f"    Commit: {commit_data['sha']} - {commit_data['message']}")
-                    except Exception as e:
-                        print(f"    Error processing commits for {repo_name}: {e}")
-                        continue
+                        # Add repository to list on its first page
+                        contributions['repositories'].append({
+                            'name': repo,
+                            'url': f"https://github.com/{repo_name}",
+                            'private': repo_data.get("isPrivate", False)
+                        })
                     
-                    # Add repository to list
-                    contributions['repositories'].append({
-                        'name': repo,
-                        'url': f"https://github.com/{repo_name}",
-                        'private': False  # We'll determine this later if needed
-                    })
+                    for commit in history["nodes"]:
+                        # Filter by author
+                        author = commit.get('author')
+                        if not author or not author.get('user') or not author['user'].get('login'):
+                            continue  # Skip commits with missing author info
+                        author_login = author['user']['login']
+                        if author_login != login:
+                            continue
+                            
+                        commit_data = CommitRec(
+                            repo=repo,
+                            sha=commit['oid'][:7],
+                            message=commit['messageHeadline'],
+                            date=_parse_github_timestamp(commit['committedDate']),
+                            url=commit['url']
+                        )
+                        contributions['commits'].append(commit_data)
+                        logger.debug("    Commit: %s - %s", commit_data.sha, commit_data.message)
                     
+                    # Request the next page of this repository's history in a later round
+                    page_info = history.get("pageInfo") or {}
+                    if page_info.get("hasNextPage"):
+                        pending[alias] = (repo_name, page_info["endCursor"])
                 except Exception as e:
-                    print(f"Error processing repository {repo_name}: {e}")
+                    print(f"    Error processing commits for {repo_name}: {e}")
                     continue
-            
-            # Small delay between batches to respect rate limits
-            if i + batch_size < len(repos_with_contributions):
-                import time
-                time.sleep(1)
         
-        # Print summary of all commits found
-        if contributions['commits']:
-            print(f"\n📊 COMMIT SUMMARY:")
-            print(f"Total commits found: {len(contributions['commits'])}")
-            print(f"Repositories with commits: {len(set(commit['repo'] for commit in contributions['commits']))}")
-            print(f"\nAll commits:")
-            for commit in contributions['commits']:
-                print(f"  {commit['repo']}: {commit['sha']} - {commit['message']}")
+        self._print_summary(contributions)
         
         # Check if we found any commits, if not fall back to conservative approach
         if not contributions['commits']:
@@ -432,6 +709,43 @@ class GitHubContributionsTracker:
         
         return contributions
     
+    def _fetch_repo_privacy(self, repo_names: List[str]) -> Dict[str, bool]:
+        """
+        Look up whether repositories are private with batched GraphQL queries.
+        
+        Args:
+            repo_names: Repository full names (owner/repo)
+            
+        Returns:
+            Dictionary mapping each accessible repository to its private flag
+        """
+        privacy = {}
+        batch_size = 100
+        for i in range(0, len(repo_names), batch_size):
+            batch = repo_names[i:i + batch_size]
+            aliases = []
+            for index, repo_name in enumerate(batch):
+                owner, repo = repo_name.split('/', 1)
+                aliases.append(_PRIVACY_REPOSITORY_TEMPLATE.format(
+                    alias=f"r{index}", owner=json.dumps(owner), name=json.dumps(repo)
+                ))
+            
+            try:
+                response = self._session.post(GRAPHQL_URL, json={"query": "query { " + " ".join(aliases) + " }"})
+                self._respect_rate_limits(response)
+                response.raise_for_status()
+                data = response.json().get("data") or {}
+            except Exception as e:
+                print(f"Warning: Could not look up repository visibility: {e}")
+                continue
+            
+            for index, repo_name in enumerate(batch):
+                repo_data = data.get(f"r{index}")
+                if repo_data:
+                    privacy[repo_name] = repo_data["isPrivate"]
+        
+        return privacy
+    
     def _fetch_contributions_bulk_search(self, start_date: datetime, end_date: datetime, include_private: bool = False) -> Dict[str, List[Any]]:
         """
         Fetch contributions using bulk search queries - the smartest approach.
@@ -454,10 +768,12 @@ class GitHubContributionsTracker:
         try:
             # Bulk search for commits with rate limit handling
             print("Searching for commits...")
-            commit_query = f'author:{self.user.login} committer-date:{start_date_str}..{end_date_str}'
+            commit_query = f'author:{self.login} committer-date:{start_date_str}..{end_date_str}'
+            if not include_private:
+                commit_query += ' is:public'
             
             try:
-                commits = self.github.search_commits(query=commit_query)
+                commits = self._cached_search(commit_query, self._search_ttl(end_date))
             except Exception as e:
                 if "403" in str(e) or "rate limit" in str(e).lower():
                     print("Rate limit hit for commits search, falling back to conservative approach...")
@@ -468,9 +784,9 @@ class GitHubContributionsTracker:
             # Group commits by repository
             repo_commits = {}
             for commit in commits:
-                url_parts = commit.html_url.split('/')
-                if len(url_parts) >= 5:
-                    repo_name = f"{url_parts[3]}/{url_parts[4]}"
+                match = _REPO_URL_RE.search(commit['html_url'])
+                if match:
+                    repo_name = match.group(1)
                     if repo_name not in repo_commits:
                         repo_commits[repo_name] = []
                     repo_commits[repo_name].append(commit)
@@ -480,33 +796,23 @@ class GitHubContributionsTracker:
                 owner, repo = repo_name.split('/', 1)
                 print(f"  Repository: {repo_name}")
                 for commit in repo_commit_list[:50]:  # Limit to 50 commits per repo
-                    commit_data = {
-                        'repo': repo,
-                        'sha': commit.sha[:7],
-                        'message': commit.commit.message.split('\n')[0],
-                        'date': commit.commit.author.date,
-                        'url': commit.html_url
-                    }
+                    commit_data = CommitRec(
+                        repo=repo,
+                        sha=commit['sha'][:7],
+                        message=commit['commit']['message'].partition('\n')[0],
+                        date=_parse_github_timestamp(commit['commit']['author']['date']),
+                        url=commit['html_url']
+                    )
                     contributions['commits'].append(commit_data)
-                    print(f"    Commit: {commit_data['sha']} - {commit_data['message']}")
+                    logger.debug("    Commit: %s - %s", commit_data.sha, commit_data.message)
             
             print(f"Found {len(contributions['commits'])} commits across {len(repo_commits)} repositories")
             
             # Combine all repositories (only commits)
             all_repos = set(repo_commits.keys())
             
-            # Filter private repositories if needed
-            if not include_private:
-                public_repos = set()
-                for repo_name in all_repos:
-                    try:
-                        repo = self.github.get_repo(repo_name)
-                        if not repo.private:
-                            public_repos.add(repo_name)
-                    except Exception:
-                        # Skip if we can't access (likely private)
-                        continue
-                all_repos = public_repos
+            # The search already excluded private repositories unless they were requested
+            privacy = self._fetch_repo_privacy(list(all_repos)) if include_private else {}
             
             # Add repositories to contributions
             for repo_name in all_repos:
@@ -514,19 +820,12 @@ class GitHubContributionsTracker:
                 contributions['repositories'].append({
                     'name': repo,
                     'url': f"https://github.com/{repo_name}",
-                    'private': False  # We'll determine this later if needed
+                    'private': privacy.get(repo_name, False)
                 })
             
             print(f"Total repositories with contributions: {len(contributions['repositories'])}")
             
-            # Print summary of all commits found
-            if contributions['commits']:
-                print(f"\n📊 COMMIT SUMMARY:")
-                print(f"Total commits found: {len(contributions['commits'])}")
-                print(f"Repositories with commits: {len(set(commit['repo'] for commit in contributions['commits']))}")
-                print(f"\nAll commits:")
-                for commit in contributions['commits']:
-                    print(f"  {commit['repo']}: {commit['sha']} - {commit['message']}")
+            self._print_summary(contributions)
             
         except Exception as e:
             print(f"Error in bulk search: {e}")
@@ -550,70 +849,56 @@ class GitHubContributionsTracker:
         
         print("Using conservative approach to avoid rate limits...")
         
+        # Names already listed in contributions['repositories']
+        seen_repos = set()
+        
         # Process in weekly chunks to avoid rate limits
-        current_date = start_date
         chunk_size = timedelta(days=7)
+        chunk_count = max(0, math.ceil((end_date - start_date) / chunk_size))
+        chunks = [(start_date + k * chunk_size, min(start_date + (k + 1) * chunk_size, end_date))
+                  for k in range(chunk_count)]
+        
+        def search_chunk(chunk):
+            try:
+                return self._get_repos_with_contributions(chunk[0], chunk[1], include_private)
+            except Exception as e:
+                return e
         
-        while current_date < end_date:
-            chunk_end = min(current_date + chunk_size, end_date)
+        # Search all chunks up front; the shared limiter keeps them under the search quota
+        with ThreadPoolExecutor(max_workers=MAX_CHUNK_WORKERS) as executor:
+            chunk_repos_list = list(executor.map(search_chunk, chunks))
+        
+        for (current_date, chunk_end), repos_with_contributions in zip(chunks, chunk_repos_list):
             print(f"Processing chunk: {current_date.date()} to {chunk_end.date()}")
             
             try:
-                # Get repositories with contributions for this chunk
-                repos_with_contributions = self._get_repos_with_contributions(current_date, chunk_end, include_private)
+                if isinstance(repos_with_contributions, Exception):
+                    raise repos_with_contributions
                 
                 if repos_with_contributions:
-                    # Process each repository individually for this chunk
-                    for repo_name in repos_with_contributions[:10]:  # Limit to 10 repos per chunk
-                        try:
-                            repo = self.github.get_repo(repo_name)
-                            
-                            # Get commits for this chunk
-                            commits = repo.get_commits(since=current_date, until=chunk_end, author=self.user)
-                            print(f"  Repository: {repo_name}")
-                            for commit in commits:
-                                commit_data = {
-                                    'repo': repo.name,
-                                    'sha': commit.sha[:7],
-                                    'message': commit.commit.message.split('\n')[0],
-                                    'date': commit.commit.author.date,
-                                    'url': commit.html_url
-                                }
-                                contributions['commits'].append(commit_data)
-                                print(f"    Commit: {commit_data['sha']} - {commit_data['message']}")
-                            
-
-                            
-                            # Add repository if not already added
-                            repo_exists = any(r['name'] == repo.name for r in contributions['repositories'])
-                            if not repo_exists:
-                                contributions['repositories'].append({
-                                    'name': repo.name,
-                                    'url': repo.html_url,
-                                    'private': repo.private
-                                })
-                                
-                        except Exception as e:
-                            print(f"Error processing repository {repo_name}: {e}")
+                    # Fetch the repositories of this chunk concurrently
+                    chunk_repos = repos_with_contributions[:10]  # Limit to 10 repos per chunk
+                    results = self._fetch_repos_commits(chunk_repos, current_date, chunk_end)
+                    for repo_name, result in zip(chunk_repos, results):
+                        if isinstance(result, Exception):
+                            print(f"Error processing repository {repo_name}: {result}")
                             continue
-                
-                # Small delay between chunks
-                import time
-                time.sleep(2)
+                        
+                        repository, commits = result
+                        print(f"  Repository: {repo_name}")
+                        for commit_data in commits:
+                            contributions['commits'].append(commit_data)
+                            logger.debug("    Commit: %s - %s", commit_data.sha, commit_data.message)
+                        
+                        # Add repository if not already added
+                        if repository['name'] not in seen_repos:
+                            seen_repos.add(repository['name'])
+                            contributions['repositories'].append(repository)
                 
             except Exception as e:
                 print(f"Error processing chunk {current_date.date()} to {chunk_end.date()}: {e}")
-            
-            current_date = chunk_end
         
-        # Print summary of all commits found
-        if contributions['commits']:
-            print(f"\n📊 COMMIT SUMMARY:")
-            print(f"Total commits found: {len(contributions['commits'])}")
-            print(f"Repositories with commits: {len(set(commit['repo'] for commit in contributions['commits']))}")
-            print(f"\nAll commits:")
-            for commit in contributions['commits']:
-                print(f"  {commit['repo']}: {commit['sha']} - {commit['message']}")
+        self._print_summary(contributions)
         
         return contributions
     
@@ -628,69 +913,73 @@ class GitHubContributionsTracker:
         Returns:
             Formatted summary string
         """
-        summary = []
+        if not contributions['commits'] and not contributions['repositories']:
+            return _EMPTY_MD if format_type == 'markdown' else _EMPTY_TXT
+        
+        buf = io.StringIO()
+        buf.writelines(self.iter_summary(contributions, format_type))
+        return buf.getvalue()
+    
+    def iter_summary(self, contributions: Dict[str, List[Any]], format_type: str = 'markdown') -> Iterator[str]:
+        """
+        Generate a formatted summary of contributions piece by piece.
         
+        Joining the pieces gives the same text as generate_summary, without the
+        whole document ever being held in memory.
+        
+        Args:
+            contributions: Dictionary of contributions
+            format_type: 'markdown' or 'plain'
+            
+        Yields:
+            Pieces of the formatted summary; every line after the header starts with its newline
+        """
         # Summary statistics
-        total_commits = len(contributions['commits'])
-        total_repos = len(contributions['repositories'])
+        commits = contributions['commits']
+        repos = contributions['repositories']
+        total_commits = len(commits)
+        total_repos = len(repos)
         
         if format_type == 'markdown':
-            summary.append("# GitHub Contributions Summary\n")
-            summary.append(f"## Overview")
-            summary.append(f"- **Total Commits**: {total_commits}")
-            summary.append(f"- **Repositories with Contributions**: {total_repos}\n")
+            yield _MD_HEADER
+            yield f"\n- **Total Commits**: {total_commits}"
+            yield f"\n- **Repositories with Contributions**: {total_repos}\n"
             
             # Commits
-            if contributions['commits']:
-                summary.append("## Commits")
-                for commit in contributions['commits']:
-                    summary.append(f"- **{commit['repo']}**: {commit['message']} ({commit['sha']})")
-                summary.append("")
-            
-
+            if commits:
+                yield "\n## Commits"
+                yield ''.join([f"\n- **{repo}**: {message} ({sha})" for repo, sha, message, _, _ in commits])
+                yield "\n"
             
             # Repositories
-            if contributions['repositories']:
-                summary.append("## Repositories with Contributions")
-                for repo in contributions['repositories']:
-                    visibility = "🔒 Private" if repo['private'] else "🌐 Public"
-                    summary.append(f"- **{repo['name']}** ({visibility})")
-                summary.append("")
+            if repos:
+                yield "\n## Repositories with Contributions"
+                for repo in repos:
+                    yield f"\n- **{repo['name']}** ({_VIS_MD[repo['private']]})"
+                yield "\n"
         
         else:  # plain text
-            summary.append("GITHUB CONTRIBUTIONS SUMMARY")
-            summary.append("=" * 40)
-            summary.append("")
-            summary.append("OVERVIEW")
-            summary.append("-" * 10)
-            summary.append(f"Total Commits: {total_commits}")
-            summary.append(f"Repositories with Contributions: {total_repos}")
-            summary.append("")
+            yield _PLAIN_HEADER
+            yield f"\nTotal Commits: {total_commits}"
+            yield f"\nRepositories with Contributions: {total_repos}"
+            yield "\n"
             
             # Commits
-            if contributions['commits']:
-                summary.append("COMMITS")
-                summary.append("-" * 10)
-                for commit in contributions['commits']:
-                    summary.append(f"- {commit['repo']}: {commit['message']} ({commit['sha']})")
-                summary.append("")
-            
-
+            if commits:
+                yield "\n" + _PLAIN_COMMITS_HDR
+                yield ''.join([f"\n- {repo}: {message} ({sha})" for repo, sha, message, _, _ in commits])
+                yield "\n"
             
             # Repositories
-            if contributions['repositories']:
-                summary.append("REPOSITORIES WITH CONTRIBUTIONS")
-                summary.append("-" * 32)
-                for repo in contributions['repositories']:
-                    visibility = "Private" if repo['private'] else "Public"
-                    summary.append(f"- {repo['name']} ({visibility})")
-                summary.append("")
-        
-        return '\n'.join(summary)
+            if repos:
+                yield "\n" + _PLAIN_REPOS_HDR
+                for repo in repos:
+                    yield f"\n- {repo['name']} ({_VIS_TXT[repo['private']]})"
+                yield "\n"
     
     def generate_bedrock_summary(self, contributions: Dict[str, List[Any]], 
-                                model_id: str = "anthropic.claude-3-sonnet-20240229-v1:0",
-                                region: str = "us-east-1") -> str:
+                                model_id: str = DEFAULT_MODEL_ID,
+                                region: str = "us-east-1", use_cache: bool = False) -> str:
         """
         Generate a summarized version of contributions using Amazon Bedrock.
         
@@ -698,41 +987,196 @@ class GitHubContributionsTracker:
             contributions: Dictionary of contributions
             model_id: Bedrock model ID to use
             region: AWS region for Bedrock
+            use_cache: Reuse summaries cached on disk for identical contributions
             
         Returns:
             Summarized contributions in markdown format
         """
-        # First generate the regular summary to use as input
-        regular_summary = self.generate_summary(contributions, 'markdown')
+        from .bedrock_summarizer import BedrockSummarizer, CHUNK_THRESHOLD
+        
+        # Compact summary to use as input
+        regular_summary = self._build_bedrock_prompt_body(contributions)
         
         # Create Bedrock summarizer
-        summarizer = BedrockSummarizer(model_id=model_id, region=region)
+        summarizer = BedrockSummarizer(model_id=model_id, region=region, use_cache=use_cache)
         
         # Generate the AI-powered summary
         print("Generating AI-powered summary using Amazon Bedrock...")
-        bedrock_summary = summarizer.summarize_contributions(regular_summary)
+        if len(regular_summary) > CHUNK_THRESHOLD:
+            # Very long histories are summarized in parallel chunks, then merged
+            bedrock_summary = summarizer.summarize_map_reduce(regular_summary)
+        else:
+            bedrock_summary = summarizer.summarize_contributions(regular_summary)
+        
+        return self._insert_low_level_tasks(bedrock_summary, contributions)
+    
+    def stream_bedrock_summary(self, contributions: Dict[str, List[Any]],
+                               model_id: str = DEFAULT_MODEL_ID,
+                               region: str = "us-east-1", use_cache: bool = False) -> Iterator[str]:
+        """
+        Generate a Bedrock summary, yielding the text as it is produced.
+        
+        The low-level tasks section is inserted before "## High-Level Tasks
+        Completed" as soon as that heading arrives, or appended at the end if
+        the model never writes it. Without commits the text is passed through.
+        
+        Args:
+            contributions: Dictionary of contributions
+            model_id: Bedrock model ID to use
+            region: AWS region for Bedrock
+            use_cache: Reuse summaries cached on disk for identical contributions
+            
+        Yields:
+            Pieces of the summarized contributions in markdown format
+        """
+        from .bedrock_summarizer import BedrockSummarizer
+        
+        regular_summary = self._build_bedrock_prompt_body(contributions)
+        summarizer = BedrockSummarizer(model_id=model_id, region=region, use_cache=use_cache)
+        
+        print("Generating AI-powered summary using Amazon Bedrock...")
+        if not contributions['commits']:
+            yield from summarizer.summarize_contributions_stream(regular_summary)
+            return
         
-        # Add low-level tasks section before the high-level tasks
         low_level_section = self._generate_low_level_tasks(contributions)
+        marker = "## High-Level Tasks Completed"
+        pending = ""
+        inserted = False
         
-        # Insert the low-level tasks section before "## High-Level Tasks Completed"
-        if "## High-Level Tasks Completed" in bedrock_summary:
-            bedrock_summary = bedrock_summary.replace(
-                "## High-Level Tasks Completed",
-                f"{low_level_section}\n\n## High-Level Tasks Completed"
-            )
+        for text in summarizer.summarize_contributions_stream(regular_summary):
+            if inserted:
+                yield text
+                continue
+            
+            pending += text
+            index = pending.find(marker)
+            if index != -1:
+                yield f"{pending[:index]}{low_level_section}\n\n{pending[index:]}"
+                inserted = True
+                pending = ""
+            else:
+                # Hold back enough text to catch a heading split across chunks
+                safe = len(pending) - len(marker) + 1
+                if safe > 0:
+                    yield pending[:safe]
+                    pending = pending[safe:]
+        
+        if not inserted:
+            yield f"{pending}\n\n{low_level_section}"
+    
+    def generate_bedrock_summaries(self, contributions_list: List[Dict[str, List[Any]]],
+                                   model_id: str = DEFAULT_MODEL_ID,
+                                   region: str = "us-east-1", s3_bucket: str = None,
+                                   s3_prefix: str = "github-contributions-tracker",
+                                   role_arn: str = None, max_concurrency: int = 10,
+                                   use_cache: bool = False) -> List[str]:
+        """
+        Generate Bedrock summaries for several sets of contributions at once.
+        
+        When an S3 bucket is given the summaries are produced by a single
+        Bedrock batch inference job, otherwise they are requested concurrently.
+        
+        Args:
+            contributions_list: Contributions for each user or date window
+            model_id: Bedrock model ID to use
+            region: AWS region for Bedrock
+            s3_bucket: S3 bucket for batch inference input and output
+            s3_prefix: Key prefix for the batch job files
+            role_arn: IAM role Bedrock assumes for the batch job
+            max_concurrency: Maximum number of concurrent Bedrock requests
+            use_cache: Reuse summaries cached on disk for identical contributions
+            
+        Returns:
+            Summarized contributions in markdown format, in input order
+        """
+        from .bedrock_summarizer import BedrockSummarizer
+        
+        regular_summaries = [self._build_bedrock_prompt_body(contributions) for contributions in contributions_list]
+        
+        summarizer = BedrockSummarizer(model_id=model_id, region=region, use_cache=use_cache)
+        
+        print(f"Generating {len(regular_summaries)} AI-powered summaries using Amazon Bedrock...")
+        if s3_bucket:
+            bedrock_summaries = summarizer.summarize_batch(regular_summaries, s3_bucket, s3_prefix, role_arn)
         else:
-            # If the section isn't found, append it after the overview
-            if "## Overview" in bedrock_summary:
-                overview_end = bedrock_summary.find("##", bedrock_summary.find("## Overview") + 1)
-                if overview_end == -1:
-                    bedrock_summary += f"\n\n{low_level_section}"
-                else:
-                    bedrock_summary = bedrock_summary[:overview_end] + f"\n\n{low_level_section}\n\n" + bedrock_summary[overview_end:]
+            bedrock_summaries = summarizer.summarize_many(regular_summaries, max_concurrency)
+        
+        return [self._insert_low_level_tasks(bedrock_summary, contributions)
+                for bedrock_summary, contributions in zip(bedrock_summaries, contributions_list)]
+    
+    def _build_bedrock_prompt_body(self, contributions: Dict[str, List[Any]]) -> str:
+        """
+        Build the contributions list sent to Bedrock.
+        
+        Same layout as the markdown summary, but only the most recent
+        BEDROCK_PROMPT_COMMITS commits are listed, so the prompt stays bounded
+        for very long histories.
+        
+        Args:
+            contributions: Dictionary of contributions
+            
+        Returns:
+            Markdown contributions list for the prompt
+        """
+        commits = contributions['commits']
+        repos = contributions['repositories']
+        
+        parts = [
+            _MD_HEADER,
+            f"\n- **Total Commits**: {len(commits)}",
+            f"\n- **Repositories with Contributions**: {len(repos)}\n"
+        ]
+        
+        if commits:
+            parts.append("\n## Commits")
+            if len(commits) <= BEDROCK_PROMPT_COMMITS:
+                # Identical to generate_summary, so cached Bedrock summaries still match
+                parts.append(''.join([f"\n- **{repo}**: {message} ({sha})" for repo, sha, message, _, _ in commits]))
             else:
-                bedrock_summary += f"\n\n{low_level_section}"
+                recent = heapq.nlargest(BEDROCK_PROMPT_COMMITS, commits, key=attrgetter('date'))
+                parts.append(''.join([f"\n- **{repo}**: {message} ({sha})" for repo, sha, message, _, _ in recent]))
+                parts.append(f"\n- ...and {len(commits) - BEDROCK_PROMPT_COMMITS} earlier commits")
+            parts.append("\n")
         
-        return bedrock_summary
+        if repos:
+            parts.append("\n## Repositories with Contributions")
+            parts.extend(f"\n- **{repo['name']}** ({_VIS_MD[repo['private']]})" for repo in repos)
+            parts.append("\n")
+        
+        return "".join(parts)
+    
+    def _insert_low_level_tasks(self, bedrock_summary: str, contributions: Dict[str, List[Any]]) -> str:
+        """
+        Insert the low-level tasks section into a Bedrock summary.
+        
+        Args:
+            bedrock_summary: Summary returned by Bedrock
+            contributions: Dictionary of contributions
+            
+        Returns:
+            Summary with the low-level tasks section added
+        """
+        # Without commits the section would only say so; leave the summary untouched
+        if not contributions['commits']:
+            return bedrock_summary
+        
+        # Add low-level tasks section before the high-level tasks
+        low_level_section = self._generate_low_level_tasks(contributions)
+        
+        # Insert the low-level tasks section before "## High-Level Tasks Completed"
+        head, marker, tail = bedrock_summary.partition("## High-Level Tasks Completed")
+        if marker:
+            return "".join([head, low_level_section, "\n\n", marker, tail])
+        
+        # If the section isn't found, insert it before the heading that follows the overview
+        head, marker, tail = bedrock_summary.partition("## Overview")
+        if marker:
+            overview, next_heading, rest = tail.partition("##")
+            if next_heading:
+                return "".join([head, marker, overview, "\n\n", low_level_section, "\n\n", next_heading, rest])
+        
+        return f"{bedrock_summary}\n\n{low_level_section}"
     
     def _generate_low_level_tasks(self, contributions: Dict[str, List[Any]]) -> str:
         """
@@ -744,27 +1188,20 @@ class GitHubContributionsTracker:
         Returns:
             Formatted low-level tasks section
         """
-        if not contributions['commits']:
+        commits = contributions['commits']
+        if not commits:
             return "## Low-Level Tasks\n\nNo commits found in the specified time period."
         
-        # Group commits by repository
-        repo_commits = {}
-        for commit in contributions['commits']:
-            repo_name = commit['repo']
-            if repo_name not in repo_commits:
-                repo_commits[repo_name] = []
-            repo_commits[repo_name].append(commit)
+        # Group commits by repository; the sort is stable so commit order is kept
+        by_repo = attrgetter('repo')
+        commits = sorted(commits, key=by_repo)
         
-        # Generate the low-level tasks section
-        low_level_section = ["## Low-Level Tasks\n"]
+        # One block per repository, separated by an empty line. Formatting holds
+        # the GIL, so the blocks are built sequentially rather than in a thread pool
+        blocks = [_format_repo_block(repo_name, repo_commits)
+                  for repo_name, repo_commits in groupby(commits, key=by_repo)]
         
-        for repo_name in sorted(repo_commits.keys()):
-            low_level_section.append(f"  Repository: {repo_name}")
-            for commit in repo_commits[repo_name]:
-                low_level_section.append(f"    Commit: {commit['sha']} - {commit['message']}")
-            low_level_section.append("")  # Empty line between repositories
-        
-        return '\n'.join(low_level_section)
+        return "## Low-Level Tasks\n\n" + '\n\n'.join(blocks) + "\n"
     
     def generate_repos_only_summary(self, contributions: Dict[str, List[Any]], format_type: str = 'markdown') -> str:
         """
@@ -777,43 +1214,65 @@ class GitHubContributionsTracker:
         Returns:
             Formatted summary string
         """
-        summary = []
-        total_repos = len(contributions['repositories'])
+        repos = contributions['repositories']
+        if not repos:
+            return _EMPTY_REPOS_ONLY_MD if format_type == 'markdown' else _EMPTY_REPOS_ONLY_TXT
+        
+        buf = io.StringIO()
+        write = buf.write
+        total_repos = len(repos)
         
         if format_type == 'markdown':
-            summary.append("# Repositories with Contributions\n")
-            summary.append(f"**Total Repositories**: {total_repos}\n")
-            
-            if contributions['repositories']:
-                summary.append("## Repository List")
-                for repo in contributions['repositories']:
-                    visibility = "🔒 Private" if repo['private'] else "🌐 Public"
-                    summary.append(f"- **{repo['name']}** ({visibility}) - {repo['url']}")
-                summary.append("")
+            write(_MD_REPOS_ONLY_HEADER)
+            write(f"\n**Total Repositories**: {total_repos}\n")
+            write("\n## Repository List")
+            buf.writelines(f"\n- **{repo['name']}** ({_VIS_MD[repo['private']]}) - {repo['url']}" for repo in repos)
+            write("\n")
         else:  # plain text
-            summary.append("REPOSITORIES WITH CONTRIBUTIONS")
-            summary.append("=" * 40)
-            summary.append("")
-            summary.append(f"Total Repositories: {total_repos}")
-            summary.append("")
-            
-            if contributions['repositories']:
-                summary.append("REPOSITORY LIST")
-                summary.append("-" * 15)
-                for repo in contributions['repositories']:
-                    visibility = "Private" if repo['private'] else "Public"
-                    summary.append(f"- {repo['name']} ({visibility}) - {repo['url']}")
-                summary.append("")
-        
-        return '\n'.join(summary)
+            write(_PLAIN_REPOS_ONLY_HEADER)
+            write(f"\nTotal Repositories: {total_repos}")
+            write("\n")
+            write("\n" + _PLAIN_REPO_LIST_HDR)
+            buf.writelines(f"\n- {repo['name']} ({_VIS_TXT[repo['private']]}) - {repo['url']}" for repo in repos)
+            write("\n")
+        
+        return buf.getvalue()
+    
+    def save_summary(self, summary: str, filename: str = None, platform_newlines: bool = False):
+        """
+        Save the summary to a file, encoded as UTF-8 in one pass.
+        
+        Args:
+            summary: Summary text to write
+            filename: Output file (default: timestamped markdown file)
+            platform_newlines: Translate line endings to os.linesep
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"github_contributions_{timestamp}.md"
+        
+        if platform_newlines and os.linesep != '\n':
+            summary = summary.replace('\n', os.linesep)
+        
+        with open(filename, 'wb') as f:
+            f.write(summary.encode('utf-8'))
+        
+        print(f"Summary saved to: {filename}")
     
-    def save_summary(self, summary: str, filename: str = None):
-        """Save the summary to a file."""
+    def save_summary_iter(self, chunks: Iterable[str], filename: str = None, platform_newlines: bool = False):
+        """
+        Save a summary given as pieces, such as those from iter_summary, to a file.
+        
+        Args:
+            chunks: Pieces of the summary, written as they are produced
+            filename: Output file (default: timestamped markdown file)
+            platform_newlines: Translate line endings to os.linesep
+        """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"github_contributions_{timestamp}.md"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(summary)
+        with open(filename, 'w', encoding='utf-8', newline=None if platform_newlines else '') as f:
+            f.writelines(chunks)
         
-        print(f"Summary saved to: {filename}") 
+        print(f"Summary saved to: {filename}")
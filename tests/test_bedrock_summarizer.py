@@ -3,11 +3,28 @@
 Tests for BedrockSummarizer
 """
 
+import asyncio
+import tempfile
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, AsyncMock, patch
 import json
 
-from src.github_contributions_tracker.bedrock_summarizer import BedrockSummarizer
+from botocore.credentials import Credentials
+from botocore.exceptions import ClientError
+
+from src.github_contributions_tracker import bedrock_summarizer
+from src.github_contributions_tracker.bedrock_summarizer import BedrockSummarizer, CHUNK_THRESHOLD, _get_bedrock_client, _EMPTY_SUMMARY_TEMPLATE
+
+SAMPLE_CONTRIBUTIONS = """# GitHub Contributions Summary
+
+## Overview
+- **Total Commits**: 2
+- **Repositories with Contributions**: 1
+
+## Commits
+- **backend-api**: Add login endpoint (a1b2c3d)
+- **backend-api**: Fix token refresh (e4f5g6h)
+"""
 
 
 class TestBedrockSummarizer(unittest.TestCase):
@@ -16,6 +33,12 @@ class TestBedrockSummarizer(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.summarizer = BedrockSummarizer()
+        # Let each test create its own (possibly mocked) client
+        _get_bedrock_client.cache_clear()
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        _get_bedrock_client.cache_clear()
     
     def test_init(self):
         """Test BedrockSummarizer initialization."""
@@ -29,6 +52,30 @@ class TestBedrockSummarizer(unittest.TestCase):
         self.assertEqual(summarizer.max_tokens, 1000)
         self.assertIsNotNone(summarizer.bedrock_runtime)
     
+    def test_build_request_body(self):
+        """Test the pre-encoded request body is valid JSON with the prompt."""
+        summarizer = BedrockSummarizer(max_tokens=1234)
+        body = summarizer._build_request_body('Say "hi"\n')
+        
+        self.assertEqual(json.loads(body), {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 1234,
+            "messages": [{"role": "user", "content": 'Say "hi"\n'}]
+        })
+    
+    @patch('boto3.client')
+    def test_client_shared_per_region(self, mock_boto3_client):
+        """Test summarizers in the same region reuse one client."""
+        mock_boto3_client.side_effect = lambda **kwargs: Mock()
+        
+        first = BedrockSummarizer(region="us-east-1")
+        second = BedrockSummarizer(region="us-east-1")
+        other = BedrockSummarizer(region="us-west-2")
+        
+        self.assertIs(first.bedrock_runtime, second.bedrock_runtime)
+        self.assertIsNot(first.bedrock_runtime, other.bedrock_runtime)
+        self.assertEqual(mock_boto3_client.call_count, 2)
+    
     def test_create_summary_prompt(self):
         """Test prompt creation."""
         contributions = "# Test Contributions\n- Commit 1\n- Commit 2"
@@ -56,23 +103,266 @@ class TestBedrockSummarizer(unittest.TestCase):
         mock_boto3_client.return_value = mock_bedrock_client
         
         summarizer = BedrockSummarizer()
-        result = summarizer.summarize_contributions("Test contributions")
+        result = summarizer.summarize_contributions(SAMPLE_CONTRIBUTIONS)
         
         self.assertEqual(result, "Test AI summary")
         mock_bedrock_client.invoke_model.assert_called_once()
     
+    @patch('boto3.client')
+    def test_summarize_contributions_trivial_input(self, mock_boto3_client):
+        """Test empty or zero-commit inputs skip the Bedrock call."""
+        mock_bedrock_client = Mock()
+        mock_boto3_client.return_value = mock_bedrock_client
+        
+        summarizer = BedrockSummarizer()
+        zero_commits = SAMPLE_CONTRIBUTIONS.replace("Total Commits**: 2", "Total Commits**: 0")
+        
+        self.assertEqual(summarizer.summarize_contributions("   \n"), _EMPTY_SUMMARY_TEMPLATE)
+        self.assertEqual(summarizer.summarize_contributions(zero_commits), _EMPTY_SUMMARY_TEMPLATE)
+        mock_bedrock_client.invoke_model.assert_not_called()
+    
+    @patch('boto3.client')
+    def test_summarize_contributions_cached(self, mock_boto3_client):
+        """Test cached summaries skip the Bedrock call."""
+        mock_response = Mock()
+        mock_response.get.return_value.read.return_value = json.dumps({
+            'content': [{'text': 'Cached AI summary'}]
+        })
+        mock_bedrock_client = Mock()
+        mock_bedrock_client.invoke_model.return_value = mock_response
+        mock_boto3_client.return_value = mock_bedrock_client
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict('os.environ', {'GHCT_CACHE_DIR': cache_dir}):
+                summarizer = BedrockSummarizer(use_cache=True)
+                first = summarizer.summarize_contributions(SAMPLE_CONTRIBUTIONS)
+                second = BedrockSummarizer(use_cache=True).summarize_contributions(SAMPLE_CONTRIBUTIONS)
+        
+        self.assertEqual(first, "Cached AI summary")
+        self.assertEqual(second, "Cached AI summary")
+        mock_bedrock_client.invoke_model.assert_called_once()
+    
+    @patch('boto3.client')
+    def test_summarize_contributions_stream(self, mock_boto3_client):
+        """Test streamed summarization yields text deltas only."""
+        events = [
+            {'chunk': {'bytes': json.dumps({'type': 'message_start'}).encode()}},
+            {'chunk': {'bytes': json.dumps({'type': 'content_block_delta', 'delta': {'text': '\n# Summary'}}).encode()}},
+            {'chunk': {'bytes': json.dumps({'type': 'content_block_delta', 'delta': {'text': ' text'}}).encode()}},
+            {'chunk': {'bytes': json.dumps({'type': 'message_stop'}).encode()}},
+        ]
+        mock_bedrock_client = Mock()
+        mock_bedrock_client.invoke_model_with_response_stream.return_value = {'body': events}
+        mock_boto3_client.return_value = mock_bedrock_client
+        
+        summarizer = BedrockSummarizer()
+        result = list(summarizer.summarize_contributions_stream(SAMPLE_CONTRIBUTIONS))
+        
+        self.assertEqual(result, ['# Summary', ' text'])
+    
     @patch('boto3.client')
     def test_summarize_contributions_error(self, mock_boto3_client):
-        """Test error handling in summarization."""
+        """Test throttling errors are reported in the summary."""
+        mock_bedrock_client = Mock()
+        mock_bedrock_client.invoke_model.side_effect = ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': 'Too many requests'}}, 'InvokeModel'
+        )
+        mock_boto3_client.return_value = mock_bedrock_client
+        
+        summarizer = BedrockSummarizer()
+        result = summarizer.summarize_contributions(SAMPLE_CONTRIBUTIONS)
+        
+        self.assertIn("Error generating summary", result)
+        self.assertIn(SAMPLE_CONTRIBUTIONS, result)
+    
+    @patch('boto3.client')
+    def test_summarize_contributions_reraises_other_errors(self, mock_boto3_client):
+        """Test non-throttling errors propagate to the caller."""
         mock_bedrock_client = Mock()
-        mock_bedrock_client.invoke_model.side_effect = Exception("Test error")
+        mock_bedrock_client.invoke_model.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDeniedException', 'Message': 'Denied'}}, 'InvokeModel'
+        )
         mock_boto3_client.return_value = mock_bedrock_client
         
         summarizer = BedrockSummarizer()
-        result = summarizer.summarize_contributions("Test contributions")
+        
+        with self.assertRaises(ClientError):
+            summarizer.summarize_contributions(SAMPLE_CONTRIBUTIONS)
+
+    
+    def test_asummarize_contributions_success(self):
+        """Test async summarization through the signed HTTP client."""
+        mock_response = Mock(is_error=False)
+        mock_response.content = json.dumps({
+            'content': [{'text': 'Async AI summary'}]
+        }).encode()
+        
+        summarizer = BedrockSummarizer(model_id="test-model:0", region="us-west-2")
+        summarizer._client = Mock(post=AsyncMock(return_value=mock_response))
+        
+        with patch.object(bedrock_summarizer, '_CREDENTIALS', Credentials('access-key', 'secret-key')):
+            result = asyncio.run(summarizer.asummarize_contributions(SAMPLE_CONTRIBUTIONS))
+        
+        self.assertEqual(result, "Async AI summary")
+        url = summarizer._client.post.call_args[0][0]
+        headers = summarizer._client.post.call_args[1]['headers']
+        self.assertEqual(url, "https://bedrock-runtime.us-west-2.amazonaws.com/model/test-model%3A0/invoke")
+        self.assertIn('Authorization', headers)
+    
+    def test_asummarize_contributions_error(self):
+        """Test throttled HTTP responses are reported in the async summary."""
+        mock_response = Mock(is_error=True, status_code=429, text='{"message":"Too many requests"}')
+        mock_response.headers = {'x-amzn-ErrorType': 'ThrottlingException:http://internal.amazon.com/coral/'}
+        
+        summarizer = BedrockSummarizer()
+        summarizer._client = Mock(post=AsyncMock(return_value=mock_response))
+        
+        with patch.object(bedrock_summarizer, '_CREDENTIALS', Credentials('access-key', 'secret-key')):
+            result = asyncio.run(summarizer.asummarize_contributions(SAMPLE_CONTRIBUTIONS))
         
         self.assertIn("Error generating summary", result)
-        self.assertIn("Test contributions", result)
+        self.assertIn(SAMPLE_CONTRIBUTIONS, result)
+    
+    @patch('boto3.Session')
+    def test_credentials_resolved_once(self, mock_session):
+        """Test the credential chain is resolved once and reused for signing."""
+        mock_session.return_value.get_credentials.return_value = Credentials('access-key', 'secret-key')
+        
+        with patch.object(bedrock_summarizer, '_CREDENTIALS', None):
+            first = bedrock_summarizer._get_frozen_credentials()
+            second = bedrock_summarizer._get_frozen_credentials()
+        
+        self.assertEqual(first.access_key, 'access-key')
+        self.assertEqual(second, first)
+        mock_session.assert_called_once()
+
+    
+    @patch('src.github_contributions_tracker.bedrock_summarizer._import_httpx', return_value=None)
+    @patch('boto3.client')
+    def test_asummarize_contributions_executor_fallback(self, mock_boto3_client, mock_import_httpx):
+        """Test async summarization falls back to boto3 in a thread pool."""
+        mock_response = Mock()
+        mock_response.get.return_value.read.return_value = json.dumps({
+            'content': [{'text': 'Threaded AI summary'}]
+        })
+        mock_bedrock_client = Mock()
+        mock_bedrock_client.invoke_model.return_value = mock_response
+        mock_boto3_client.return_value = mock_bedrock_client
+        
+        summarizer = BedrockSummarizer()
+        result = asyncio.run(summarizer.asummarize_contributions(SAMPLE_CONTRIBUTIONS))
+        
+        self.assertEqual(result, "Threaded AI summary")
+        mock_bedrock_client.invoke_model.assert_called_once()
+    
+    def test_asummarize_many_limits_concurrency(self):
+        """Test fan-out keeps order and respects the concurrency limit."""
+        summarizer = BedrockSummarizer()
+        in_flight = []
+        peak = []
+        
+        async def fake_summarize(contributions_list):
+            in_flight.append(contributions_list)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(contributions_list)
+            if contributions_list == "bad":
+                raise RuntimeError("boom")
+            return contributions_list.upper()
+        
+        summarizer.asummarize_contributions = fake_summarize
+        result = asyncio.run(summarizer.asummarize_many(["a", "b", "c", "d"], max_concurrency=2))
+        
+        self.assertEqual(result, ["A", "B", "C", "D"])
+        self.assertLessEqual(max(peak), 2)
+        
+        with self.assertRaises(RuntimeError):
+            asyncio.run(summarizer.asummarize_many(["a", "bad", "c"], max_concurrency=2))
+    
+    def test_summarize_map_reduce(self):
+        """Test large inputs are summarized per chunk and then merged."""
+        commits = "\n".join(f"- **repo{i % 3}**: Change number {i} (sha{i:04d})" for i in range(60))
+        contributions = f"# GitHub Contributions Summary\n\n## Overview\n- **Total Commits**: 60\n\n## Commits\n{commits}\n"
+        prompts = []
+        
+        async def fake_invoke(prompt):
+            prompts.append(prompt)
+            return f"partial {len(prompts)}" if "one part" in prompt else "Merged summary"
+        
+        summarizer = BedrockSummarizer()
+        summarizer._ainvoke = fake_invoke
+        result = summarizer.summarize_map_reduce(contributions, chunk_chars=600)
+        
+        chunk_prompts = [p for p in prompts if "one part" in p]
+        self.assertEqual(result, "Merged summary")
+        self.assertGreater(len(chunk_prompts), 1)
+        self.assertTrue(all("## Commits" in p and len(p) < 1000 for p in chunk_prompts))
+        self.assertTrue(all(f"sha{i:04d}" in "".join(chunk_prompts) for i in range(60)))
+        self.assertIn("**Total Commits**: 60", prompts[-1])
+        self.assertIn("## High-Level Tasks Completed", prompts[-1])
+    
+    def test_summarize_map_reduce_zero_commits(self):
+        """Test a long list with no commits is not sent to Bedrock in chunks."""
+        repos = "\n".join(f"- **org/repo{i}** (🌐 Public)" for i in range(1000))
+        contributions = (f"# GitHub Contributions Summary\n\n## Overview\n- **Total Commits**: 0\n"
+                         f"- **Repositories with Contributions**: 1000\n\n## Repositories with Contributions\n{repos}\n")
+        self.assertGreater(len(contributions), CHUNK_THRESHOLD)
+        
+        summarizer = BedrockSummarizer()
+        summarizer._ainvoke = Mock(side_effect=AssertionError("Bedrock should not be called"))
+        
+        self.assertEqual(summarizer.summarize_map_reduce(contributions), _EMPTY_SUMMARY_TEMPLATE)
+    
+    @patch('time.sleep')
+    @patch('boto3.client')
+    def test_summarize_batch(self, mock_boto3_client, mock_sleep):
+        """Test batch summarization maps job output back to input order."""
+        manifests = []
+        
+        def upload_file(path, bucket, key):
+            with open(path, encoding='utf-8') as f:
+                manifests.append([json.loads(line) for line in f])
+        
+        mock_s3 = Mock()
+        mock_s3.upload_file.side_effect = upload_file
+        mock_bedrock = Mock()
+        mock_bedrock.create_model_invocation_job.return_value = {'jobArn': 'arn:aws:bedrock:us-east-1:1:model-invocation-job/job123'}
+        mock_bedrock.get_model_invocation_job.side_effect = [{'status': 'InProgress'}, {'status': 'Completed'}]
+        clients = {'s3': mock_s3, 'bedrock': mock_bedrock}
+        mock_boto3_client.side_effect = lambda service_name, **kwargs: clients.get(service_name, Mock())
+        
+        def get_object(Bucket, Key):
+            records = manifests[0]
+            lines = [
+                json.dumps({'recordId': records[1]['recordId'], 'modelOutput': {'content': [{'text': 'Summary B'}]}}).encode(),
+                json.dumps({'recordId': records[0]['recordId'], 'modelOutput': {'content': [{'text': 'Summary A'}]}}).encode(),
+            ]
+            self.assertTrue(Key.endswith('/output/job123/input.jsonl.out'))
+            return {'Body': Mock(iter_lines=Mock(return_value=lines))}
+        
+        mock_s3.get_object.side_effect = get_object
+        
+        summarizer = BedrockSummarizer()
+        result = summarizer.summarize_batch([SAMPLE_CONTRIBUTIONS + "A", "", SAMPLE_CONTRIBUTIONS + "B"], "bucket", "prefix", "arn:role")
+        
+        self.assertEqual(result, ["Summary A", _EMPTY_SUMMARY_TEMPLATE, "Summary B"])
+        self.assertEqual(len(manifests[0]), 2)
+        self.assertIn(SAMPLE_CONTRIBUTIONS + "A", manifests[0][0]['modelInput']['messages'][0]['content'])
+        mock_sleep.assert_called_once()
+    
+    @patch('boto3.client')
+    def test_summarize_batch_reraises_other_errors(self, mock_boto3_client):
+        """Test batch failures other than throttling are not turned into error summaries."""
+        mock_s3 = Mock()
+        mock_s3.upload_file.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Denied'}}, 'PutObject'
+        )
+        mock_boto3_client.return_value = mock_s3
+        
+        summarizer = BedrockSummarizer()
+        
+        with self.assertRaises(ClientError):
+            summarizer.summarize_batch([SAMPLE_CONTRIBUTIONS], "bucket", "prefix", "arn:role")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for DiskCache
+"""
+
+import json
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.github_contributions_tracker.cache import DiskCache
+
+
+class TestDiskCache(unittest.TestCase):
+    """Test cases for DiskCache class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = DiskCache('test', directory=self.tmp_dir.name)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp_dir.cleanup()
+    
+    def test_get_missing_key(self):
+        """Test a missing key returns the default."""
+        self.assertIsNone(self.cache.get('missing'))
+        self.assertEqual(self.cache.get('missing', 'fallback'), 'fallback')
+    
+    def test_set_and_get(self):
+        """Test values round-trip through the cache."""
+        self.cache.set('key', {'summary': 'text', 'count': 2})
+        
+        self.assertEqual(self.cache.get('key'), {'summary': 'text', 'count': 2})
+        self.assertEqual(DiskCache('test', directory=self.tmp_dir.name).get('key'), {'summary': 'text', 'count': 2})
+        self.assertIsNone(DiskCache('other', directory=self.tmp_dir.name).get('key'))
+    
+    def test_expired_entry(self):
+        """Test entries past their TTL are treated as misses."""
+        with patch('time.time', return_value=1000.0):
+            self.cache.set('key', 'value', ttl=60)
+        
+        with patch('time.time', return_value=1030.0):
+            self.assertEqual(self.cache.get('key'), 'value')
+        with patch('time.time', return_value=1061.0):
+            self.assertIsNone(self.cache.get('key'))
+
+    
+    def test_compressed_entries(self):
+        """Test compressed caches store gzip files that round-trip."""
+        cache = DiskCache('compressed', directory=self.tmp_dir.name, compress=True)
+        cache.set('key', [{'sha': 'abc123'}])
+        
+        self.assertEqual(cache.get('key'), [{'sha': 'abc123'}])
+        with open(cache._path('key'), 'rb') as f:
+            self.assertEqual(f.read(2), b'\x1f\x8b')
+    
+    def test_concurrent_writes_same_key(self):
+        """Test threads storing the same key at once each write their own temp file."""
+        cache = DiskCache('concurrent', directory=self.tmp_dir.name, compress=True)
+        barrier = threading.Barrier(2)
+        json_dump = json.dump
+        
+        def dump(obj, f):
+            # Both writers have their temp file open before either writes to it
+            barrier.wait(timeout=5)
+            json_dump(obj, f)
+        
+        values = [[{'sha': 'abc123'}] * 100, [{'sha': 'def456'}] * 10]
+        with patch('json.dump', side_effect=dump), patch('builtins.print') as mock_print:
+            threads = [threading.Thread(target=cache.set, args=('key', value)) for value in values]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        mock_print.assert_not_called()
+        self.assertIn(cache.get('key'), values)
+        self.assertEqual(list(cache.directory.glob('*.tmp')), [])
+
+if __name__ == '__main__':
+    unittest.main() 
@@ -3,11 +3,13 @@
 Tests for GitHubContributionsTracker
 """
 
+import tempfile
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone
 
-from src.github_contributions_tracker.tracker import GitHubContributionsTracker
+from src.github_contributions_tracker.cache import DiskCache
+from src.github_contributions_tracker.tracker import CommitRec, GitHubContributionsTracker, _RateLimiter
 
 
 class TestGitHubContributionsTracker(unittest.TestCase):
@@ -33,8 +35,8 @@ class TestGitHubContributionsTracker(unittest.TestCase):
         """Test markdown summary generation."""
         contributions = {
             'commits': [
-                {'repo': 'test-repo', 'message': 'Test commit', 'sha': 'abc123', 'date': datetime.now(), 'url': 'http://test.com'},
-                {'repo': 'test-repo', 'message': 'Another commit', 'sha': 'def456', 'date': datetime.now(), 'url': 'http://test.com'}
+                CommitRec(repo='test-repo', sha='abc123', message='Test commit', date=datetime.now(), url='http://test.com'),
+                CommitRec(repo='test-repo', sha='def456', message='Another commit', date=datetime.now(), url='http://test.com')
             ],
             'repositories': [
                 {'name': 'test-repo', 'url': 'http://test.com', 'private': False}
@@ -53,7 +55,7 @@ class TestGitHubContributionsTracker(unittest.TestCase):
         """Test plain text summary generation."""
         contributions = {
             'commits': [
-                {'repo': 'test-repo', 'message': 'Test commit', 'sha': 'abc123', 'date': datetime.now(), 'url': 'http://test.com'}
+                CommitRec(repo='test-repo', sha='abc123', message='Test commit', date=datetime.now(), url='http://test.com')
             ],
             'repositories': [
                 {'name': 'test-repo', 'url': 'http://test.com', 'private': False}
@@ -66,13 +68,25 @@ class TestGitHubContributionsTracker(unittest.TestCase):
         self.assertIn("Total Commits: 1", summary)
         self.assertIn("test-repo: Test commit (abc123)", summary)
     
+    def test_generate_summary_empty_matches_full_path(self):
+        """Test the precomputed empty summaries match what the builders would produce."""
+        contributions = {'commits': [], 'repositories': []}
+        
+        for format_type in ('markdown', 'plain'):
+            self.assertEqual(self.tracker.generate_summary(contributions, format_type),
+                             ''.join(self.tracker.iter_summary(contributions, format_type)))
+        
+        self.assertEqual(self.tracker.generate_repos_only_summary(contributions, 'markdown'),
+                         "# Repositories with Contributions\n\n**Total Repositories**: 0\n")
+        self.assertIn("Total Repositories: 0", self.tracker.generate_repos_only_summary(contributions, 'plain'))
+    
     def test_generate_low_level_tasks(self):
         """Test low-level tasks generation."""
         contributions = {
             'commits': [
-                {'repo': 'repo1', 'message': 'Commit 1', 'sha': 'abc123', 'date': datetime.now(), 'url': 'http://test.com'},
-                {'repo': 'repo1', 'message': 'Commit 2', 'sha': 'def456', 'date': datetime.now(), 'url': 'http://test.com'},
-                {'repo': 'repo2', 'message': 'Commit 3', 'sha': 'ghi789', 'date': datetime.now(), 'url': 'http://test.com'}
+                CommitRec(repo='repo1', sha='abc123', message='Commit 1', date=datetime.now(), url='http://test.com'),
+                CommitRec(repo='repo1', sha='def456', message='Commit 2', date=datetime.now(), url='http://test.com'),
+                CommitRec(repo='repo2', sha='ghi789', message='Commit 3', date=datetime.now(), url='http://test.com')
             ],
             'repositories': []
         }
@@ -95,6 +109,307 @@ class TestGitHubContributionsTracker(unittest.TestCase):
         self.assertIn("## Low-Level Tasks", low_level)
         self.assertIn("No commits found", low_level)
     
+    @patch('src.github_contributions_tracker.bedrock_summarizer.BedrockSummarizer')
+    def test_stream_bedrock_summary_inserts_low_level_tasks(self, mock_summarizer_class):
+        """Test streamed Bedrock output gets the low-level tasks before the high-level heading."""
+        mock_summarizer_class.return_value.summarize_contributions_stream.return_value = iter([
+            "# Summary\n\n## Overview\n- Stuff\n\n## High-Le",
+            "vel Tasks Completed\n- Task",
+        ])
+        contributions = {
+            'commits': [
+                CommitRec(repo='repo1', sha='abc123', message='Commit 1', date=datetime.now(), url='http://test.com')
+            ],
+            'repositories': []
+        }
+        
+        summary = ''.join(self.tracker.stream_bedrock_summary(contributions))
+        
+        low_level = self.tracker._generate_low_level_tasks(contributions)
+        self.assertEqual(
+            summary,
+            f"# Summary\n\n## Overview\n- Stuff\n\n{low_level}\n\n## High-Level Tasks Completed\n- Task"
+        )
+    
+    def test_build_bedrock_prompt_body(self):
+        """Test the Bedrock prompt matches the markdown summary and lists only the most recent commits."""
+        contributions = {
+            'commits': [
+                CommitRec(repo='repo1', sha=f'sha{day}', message=f'Commit {day}', date=datetime(2024, 1, day), url='http://test.com')
+                for day in range(1, 4)
+            ],
+            'repositories': [
+                {'name': 'repo1', 'url': 'http://repo1.com', 'private': False}
+            ]
+        }
+        
+        self.assertEqual(self.tracker._build_bedrock_prompt_body(contributions),
+                         self.tracker.generate_summary(contributions, 'markdown'))
+        
+        with patch('src.github_contributions_tracker.tracker.BEDROCK_PROMPT_COMMITS', 2):
+            prompt = self.tracker._build_bedrock_prompt_body(contributions)
+        
+        self.assertIn("**Total Commits**: 3", prompt)
+        self.assertIn("Commit 3 (sha3)", prompt)
+        self.assertIn("Commit 2 (sha2)", prompt)
+        self.assertNotIn("Commit 1 (sha1)", prompt)
+        self.assertIn("...and 1 earlier commits", prompt)
+    
+    def test_insert_low_level_tasks_after_overview(self):
+        """Test the low-level tasks go after the overview when there is no high-level heading."""
+        contributions = {
+            'commits': [
+                CommitRec(repo='repo1', sha='abc123', message='Commit 1', date=datetime.now(), url='http://test.com')
+            ],
+            'repositories': []
+        }
+        
+        summary = self.tracker._insert_low_level_tasks("# Summary\n\n## Overview\n- Stuff\n\n## Notes\n- Note", contributions)
+        
+        low_level = self.tracker._generate_low_level_tasks(contributions)
+        self.assertEqual(summary, f"# Summary\n\n## Overview\n- Stuff\n\n\n\n{low_level}\n\n## Notes\n- Note")
+    
+    def test_insert_low_level_tasks_skipped_without_commits(self):
+        """Test a Bedrock summary is returned unchanged when there are no commits."""
+        bedrock_summary = "# Summary\n\n## High-Level Tasks Completed\n- Task"
+        
+        summary = self.tracker._insert_low_level_tasks(bedrock_summary, {'commits': [], 'repositories': []})
+        
+        self.assertEqual(summary, bedrock_summary)
+    
+    def test_fetch_contributions_graphql_follows_cursors(self):
+        """Test repositories are batched into one query and paginated by cursor."""
+        def history(nodes, cursor=None):
+            return {'isPrivate': False, 'defaultBranchRef': {'target': {'history': {
+                'nodes': nodes,
+                'pageInfo': {'endCursor': cursor, 'hasNextPage': cursor is not None}
+            }}}}
+        
+        def node(oid, login='alice'):
+            return {'oid': oid, 'messageHeadline': f'Commit {oid}', 'committedDate': '2024-01-02T10:00:00Z',
+                    'url': f'https://github.com/org/repo/commit/{oid}', 'author': {'user': {'login': login}}}
+        
+        first = Mock(headers={})
+        first.json.return_value = {'data': {
+            'r0': history([node('aaaaaaa1'), node('bbbbbbb2', login='bob')], cursor='CURSOR'),
+            'r1': history([node('ccccccc3')])
+        }}
+        second = Mock(headers={})
+        second.json.return_value = {'data': {'r0': history([node('ddddddd4')])}}
+        
+        self.tracker.login = 'alice'
+        self.tracker._session = Mock()
+        self.tracker._session.post.side_effect = [first, second]
+        
+        contributions = self.tracker._fetch_contributions_graphql(
+            ['org/api', 'org/web'], datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 8, tzinfo=timezone.utc)
+        )
+        
+        self.assertEqual(self.tracker._session.post.call_count, 2)
+        first_query = self.tracker._session.post.call_args_list[0][1]['json']['query']
+        second_query = self.tracker._session.post.call_args_list[1][1]['json']['query']
+        self.assertIn('r1: repository(owner: "org", name: "web")', first_query)
+        self.assertIn('after: "CURSOR"', second_query)
+        self.assertNotIn('r1:', second_query)
+        self.assertEqual([commit.sha for commit in contributions['commits']], ['aaaaaaa', 'ccccccc', 'ddddddd'])
+        self.assertEqual(contributions['commits'][0].date, datetime(2024, 1, 2, 10, 0, tzinfo=timezone.utc))
+        self.assertEqual([repo['name'] for repo in contributions['repositories']], ['api', 'web'])
+    
+    def test_fetch_contributions_graphql_skips_failed_batch(self):
+        """Test a failed GraphQL request only drops the repositories of its own batch."""
+        def history(oid):
+            return {'isPrivate': False, 'defaultBranchRef': {'target': {'history': {
+                'nodes': [{'oid': oid, 'messageHeadline': f'Commit {oid}', 'committedDate': '2024-01-02T10:00:00Z',
+                           'url': f'https://github.com/org/repo/commit/{oid}', 'author': {'user': {'login': 'alice'}}}],
+                'pageInfo': {'endCursor': None, 'hasNextPage': False}
+            }}}}
+        
+        first = Mock(headers={})
+        first.json.return_value = {'data': {f'r{i}': history(f'{i:07x}1') for i in range(20)}}
+        third = Mock(headers={})
+        third.json.return_value = {'data': {f'r{i}': history(f'{i:07x}1') for i in range(40, 45)}}
+        
+        self.tracker.login = 'alice'
+        self.tracker._session = Mock()
+        self.tracker._session.post.side_effect = [first, ConnectionError("timed out"), third]
+        
+        with patch('builtins.print') as mock_print:
+            contributions = self.tracker._fetch_contributions_graphql(
+                [f'org/repo{i}' for i in range(45)],
+                datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 8, tzinfo=timezone.utc)
+            )
+        
+        self.assertEqual(self.tracker._session.post.call_count, 3)
+        self.assertEqual([repo['name'] for repo in contributions['repositories']],
+                         [f'repo{i}' for i in list(range(20)) + list(range(40, 45))])
+        self.assertEqual(len(contributions['commits']), 25)
+        printed = ' '.join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+        self.assertIn('org/repo20', printed)
+        self.assertIn('org/repo39', printed)
+    
+    def test_fetch_repos_commits_stops_at_max_commits(self):
+        """Test REST commit pages are fetched concurrently and only as far as needed."""
+        def response(payload, next_url=None):
+            mock_response = Mock(headers={})
+            mock_response.json.return_value = payload
+            mock_response.links = {'next': {'url': next_url}} if next_url else {}
+            return mock_response
+        
+        def commit(sha):
+            return {'sha': sha * 10, 'html_url': f'https://github.com/org/api/commit/{sha}',
+                    'commit': {'message': f'Commit {sha}\n\nDetails', 'author': {'date': '2024-01-02T10:00:00Z'}}}
+        
+        def get(url, params=None, headers=None):
+            if url.endswith('/repos/org/api'):
+                return response({'name': 'api', 'html_url': 'https://github.com/org/api', 'private': True})
+            if url.endswith('/repos/org/api/commits'):
+                return response([commit('a'), commit('b')], next_url='https://api.github.com/page2')
+            if url.endswith('/page2'):
+                return response([commit('c'), commit('d')], next_url='https://api.github.com/page3')
+            raise AssertionError(f"unexpected request to {url}")
+        
+        self.tracker.login = 'alice'
+        self.tracker._session = Mock()
+        self.tracker._session.get.side_effect = get
+        
+        results = self.tracker._fetch_repos_commits(
+            ['org/api'], datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 8, tzinfo=timezone.utc), max_commits=3
+        )
+        
+        repository, commits = results[0]
+        self.assertEqual(repository, {'name': 'api', 'url': 'https://github.com/org/api', 'private': True})
+        self.assertEqual([c.message for c in commits], ['Commit a', 'Commit b', 'Commit c'])
+        self.assertEqual(commits[0].sha, 'aaaaaaa')
+        self.assertEqual(self.tracker._session.get.call_count, 3)
+    
+    def test_fetch_repo_privacy_batches_graphql(self):
+        """Test repository visibility comes from one aliased GraphQL query."""
+        mock_response = Mock(headers={})
+        mock_response.json.return_value = {'data': {'r0': {'isPrivate': True}, 'r1': {'isPrivate': False}, 'r2': None}}
+        self.tracker._session = Mock()
+        self.tracker._session.post.return_value = mock_response
+        
+        privacy = self.tracker._fetch_repo_privacy(['org/secret', 'org/open', 'org/gone'])
+        
+        self.assertEqual(privacy, {'org/secret': True, 'org/open': False})
+        self.tracker._session.post.assert_called_once()
+        query = self.tracker._session.post.call_args[1]['json']['query']
+        self.assertIn('r1: repository(owner: "org", name: "open") { isPrivate }', query)
+    
+    def test_cached_search_revalidates_with_etag(self):
+        """Test stale search results are revalidated and reused on 304 Not Modified."""
+        item = {'sha': 'a' * 40, 'html_url': 'https://github.com/org/api/commit/aaa', 'url': 'ignored',
+                'commit': {'message': 'Commit', 'author': {'date': '2024-01-02T10:00:00Z', 'name': 'Alice'}}}
+        first = Mock(status_code=200, headers={'ETag': '"v1"'}, links={})
+        first.json.return_value = {'total_count': 1, 'items': [item]}
+        not_modified = Mock(status_code=304, headers={}, links={})
+        
+        self.tracker._session = Mock()
+        self.tracker._session.get.side_effect = [first, not_modified]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.tracker._search_cache = DiskCache('search', directory=cache_dir, compress=True)
+            with patch('time.time', return_value=1000.0):
+                fetched = self.tracker._cached_search('author:alice', ttl=60)
+                fresh = self.tracker._cached_search('author:alice', ttl=60)
+            with patch('time.time', return_value=2000.0):
+                revalidated = self.tracker._cached_search('author:alice', ttl=60)
+        
+        expected = [{'sha': 'a' * 40, 'html_url': 'https://github.com/org/api/commit/aaa',
+                     'commit': {'message': 'Commit', 'author': {'date': '2024-01-02T10:00:00Z'}}}]
+        self.assertEqual(fetched, expected)
+        self.assertEqual(fresh, expected)
+        self.assertEqual(revalidated, expected)
+        self.assertEqual(self.tracker._session.get.call_count, 2)
+        self.assertEqual(self.tracker._session.get.call_args[1]['headers'], {'If-None-Match': '"v1"'})
+    
+    def test_search_commits_fetches_remaining_pages(self):
+        """Test search pages after the first are requested from the last page link."""
+        def response(shas, links=None):
+            mock_response = Mock(status_code=200, headers={}, links=links or {})
+            mock_response.json.return_value = {'items': [
+                {'sha': sha, 'html_url': f'https://github.com/org/api/commit/{sha}',
+                 'commit': {'message': sha, 'author': {'date': '2024-01-02T10:00:00Z'}}}
+                for sha in shas
+            ]}
+            return mock_response
+        
+        pages = {2: response(['c', 'd']), 3: response(['e'])}
+        first = response(['a', 'b'], links={
+            'next': {'url': 'https://api.github.com/search/commits?q=x&per_page=100&page=2'},
+            'last': {'url': 'https://api.github.com/search/commits?q=x&per_page=100&page=3'}
+        })
+        
+        def get(url, params=None, headers=None):
+            return pages[params['page']] if 'page' in params else first
+        
+        self.tracker._session = Mock()
+        self.tracker._session.get.side_effect = get
+        
+        commits, _ = self.tracker._search_commits('author:alice')
+        
+        self.assertEqual([commit['sha'] for commit in commits], ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(self.tracker._session.get.call_count, 3)
+    
+    def test_get_json_uses_cached_body_on_not_modified(self):
+        """Test REST requests send the stored ETag and reuse the cached body on 304."""
+        first = Mock(status_code=200, headers={'ETag': '"abc"'}, links={})
+        first.json.return_value = [{'sha': 'a'}]
+        not_modified = Mock(status_code=304, headers={}, links={})
+        
+        self.tracker._session = Mock()
+        self.tracker._session.get.side_effect = [first, not_modified]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.tracker._http_cache = DiskCache('http', directory=cache_dir, compress=True)
+            url = 'https://api.github.com/repos/org/api/commits'
+            fetched = self.tracker._get_json(url, {'author': 'alice'})
+            revalidated = self.tracker._get_json(url, {'author': 'alice'})
+        
+        self.assertEqual(fetched, ([{'sha': 'a'}], {}))
+        self.assertEqual(revalidated, ([{'sha': 'a'}], {}))
+        self.assertEqual(self.tracker._session.get.call_args[1]['headers'], {'If-None-Match': '"abc"'})
+    
+    def test_rate_limiter_waits_for_tokens(self):
+        """Test the token bucket sleeps once its burst is used up."""
+        clock = [100.0]
+        sleeps = []
+        
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+        
+        with patch('time.monotonic', side_effect=lambda: clock[0]), patch('time.sleep', side_effect=fake_sleep):
+            limiter = _RateLimiter(2, 60)
+            for _ in range(3):
+                limiter.acquire()
+        
+        self.assertEqual(len(sleeps), 1)
+        self.assertAlmostEqual(sleeps[0], 30.0)
+    
+    @patch('time.sleep')
+    def test_fetch_contributions_conservative_searches_weekly_chunks(self, mock_sleep):
+        """Test the conservative approach searches every week of the range."""
+        self.tracker._get_repos_with_contributions = Mock(return_value=[])
+        
+        self.tracker._fetch_contributions_conservative(
+            datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 16, tzinfo=timezone.utc)
+        )
+        
+        windows = sorted(call[0][:2] for call in self.tracker._get_repos_with_contributions.call_args_list)
+        self.assertEqual([(start.day, end.day) for start, end in windows], [(1, 8), (8, 15), (15, 16)])
+        mock_sleep.assert_not_called()
+    
+    @patch('time.sleep')
+    def test_respect_rate_limits(self, mock_sleep):
+        """Test the tracker only waits when the remaining quota is nearly used up."""
+        with patch('time.time', return_value=1000.0):
+            self.tracker._respect_rate_limits(Mock(headers={'X-RateLimit-Remaining': '4000', 'X-RateLimit-Reset': '1060'}))
+            mock_sleep.assert_not_called()
+            
+            self.tracker._respect_rate_limits(Mock(headers={'X-RateLimit-Remaining': '3', 'X-RateLimit-Reset': '1060'}))
+            mock_sleep.assert_called_once_with(60.0)
+    
     def test_generate_repos_only_summary(self):
         """Test repositories-only summary generation."""
         contributions = {
@@ -121,8 +436,27 @@ class TestGitHubContributionsTracker(unittest.TestCase):
         
         self.tracker.save_summary(summary, "test.md")
         
-        mock_open.assert_called_once_with("test.md", 'w', encoding='utf-8')
-        mock_file.write.assert_called_once_with(summary)
+        mock_open.assert_called_once_with("test.md", 'wb')
+        mock_file.write.assert_called_once_with(summary.encode('utf-8'))
+    
+    def test_save_summary_iter_matches_generate_summary(self):
+        """Test a streamed summary is written to disk exactly as generate_summary returns it."""
+        contributions = {
+            'commits': [
+                CommitRec(repo='repo1', sha='abc123', message='Commit 1', date=datetime.now(), url='http://test.com')
+            ],
+            'repositories': [
+                {'name': 'repo1', 'url': 'http://repo1.com', 'private': True}
+            ]
+        }
+        
+        with tempfile.TemporaryDirectory() as directory:
+            filename = f"{directory}/summary.md"
+            self.tracker.save_summary_iter(self.tracker.iter_summary(contributions, 'plain'), filename)
+            with open(filename, encoding='utf-8') as f:
+                saved = f.read()
+        
+        self.assertEqual(saved, self.tracker.generate_summary(contributions, 'plain'))
     
     @patch('builtins.open', create=True)
     def test_save_summary_default_filename(self, mock_open):
@@ -135,7 +469,7 @@ class TestGitHubContributionsTracker(unittest.TestCase):
             mock_datetime.now.return_value.strftime.return_value = "20240101_120000"
             self.tracker.save_summary(summary)
         
-        mock_open.assert_called_once_with("github_contributions_20240101_120000.md", 'w', encoding='utf-8')
+        mock_open.assert_called_once_with("github_contributions_20240101_120000.md", 'wb')
 
 
 if __name__ == '__main__':